@@ -1,8 +1,10 @@
 """Advanced API endpoints showcasing Neo4j and LangGraph capabilities."""
 
 import re
+import json
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any, List
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, Any, List
 
 from ..core.security import verify_api_key
 from ..core.logging import get_logger
@@ -55,7 +57,7 @@ async def graph_based_analysis(
     startup_id = request.startup_id
     logger.info(f"Running graph analysis for {startup_id}")
     
-    graph = get_knowledge_graph()
+    graph = await get_knowledge_graph()
     
     # Get actual data from uploaded documents
     # Use questionnaire data directly for hackathon demo
@@ -218,6 +220,84 @@ async def graph_based_analysis(
         raise HTTPException(status_code=500, detail="Graph analysis failed")
 
 
+@router.post("/graph/similarity/refresh")
+async def refresh_graph_similarity(
+    top_k: int = 10,
+    _: str = Depends(verify_api_key)
+) -> Dict[str, Any]:
+    """
+    Rebuild startup similarity edges with a batch GDS KNN job.
+    
+    Intended for scheduled runs when NEO4J_USE_GDS is enabled.
+    """
+    if not NEO4J_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Neo4j graph features not available")
+    
+    graph = await get_knowledge_graph()
+    if not graph.driver:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+    
+    refreshed = await graph.refresh_similarity_relationships(top_k=top_k)
+    if not refreshed:
+        raise HTTPException(status_code=500, detail="Similarity refresh failed")
+    
+    return {"refreshed": True, "top_k": top_k}
+
+
+async def _ndjson_lines(records: AsyncIterator[Dict[str, Any]], label: str) -> AsyncIterator[str]:
+    """Serialize graph records to NDJSON lines as they arrive.
+    
+    The status line is already sent once streaming starts, so a failure
+    mid-stream ends the body with an {"error": ...} line instead.
+    """
+    try:
+        async for record in records:
+            yield json.dumps(record, default=str) + "\n"
+    except Exception as e:
+        logger.error(f"Streaming {label} failed: {e}")
+        yield json.dumps({"error": f"Streaming {label} failed"}) + "\n"
+
+
+@router.get("/graph/{startup_id}/similar/stream")
+async def stream_similar_startups(
+    startup_id: str,
+    limit: int = 5,
+    _: str = Depends(verify_api_key)
+):
+    """Stream similar startups as NDJSON without buffering the full result."""
+    if not NEO4J_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Neo4j graph features not available")
+    
+    graph = await get_knowledge_graph()
+    if not graph.driver:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+    
+    return StreamingResponse(
+        _ndjson_lines(graph.iter_similar_startups(startup_id, limit), "similar startups"),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/graph/{startup_id}/investors/stream")
+async def stream_investor_network(
+    startup_id: str,
+    depth: int = 2,
+    _: str = Depends(verify_api_key)
+):
+    """Stream the investor network as NDJSON without buffering the full result."""
+    if not NEO4J_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Neo4j graph features not available")
+    
+    graph = await get_knowledge_graph()
+    if not graph.driver:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+    
+    return StreamingResponse(
+        _ndjson_lines(graph.iter_investor_network(startup_id, depth), "investor network"),
+        media_type="application/x-ndjson"
+    )
+
+
 class WorkflowAnalysisRequest(BaseModel):
     startup_id: str
 
@@ -1,8 +1,11 @@
 """Video analysis API endpoints for founder assessment."""
 
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 import base64
+import copy
+import time
+import aiofiles.os
 
 from ..core.security import verify_api_key
 from ..core.logging import get_logger
@@ -12,6 +15,107 @@ from pydantic import BaseModel
 logger = get_logger(__name__)
 router = APIRouter()
 
+MAX_VIDEO_BYTES = 100 * 1024 * 1024  # 100MB limit for hackathon
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Saved uploads not analyzed within this window are deleted
+UNANALYZED_VIDEO_TTL_SECONDS = 60 * 60
+
+
+# Neutral values for sections missing from a video analysis
+_DEFAULT_ANALYSIS: Dict[str, Dict[str, Any]] = {
+    "founder_analysis": {
+        "confidence_score": 0.5,
+        "communication_clarity": 0.5,
+        "technical_depth": 0.5,
+        "passion_score": 0.5,
+        "authenticity": 0.5
+    },
+    "sentiment_analysis": {
+        "overall_sentiment": "neutral",
+        "confidence": 0.5,
+        "key_emotions": ["professional"]
+    },
+    "content_quality": {
+        "problem_articulation": 0.5,
+        "solution_clarity": 0.5,
+        "market_understanding": 0.5
+    },
+    "investment_signals": {
+        "founder_quality": 0.5,
+        "recommended_action": "pass",
+        "key_strengths": ["Professional appearance"],
+        "concerns": ["Needs more clarity"]
+    },
+    "visual_analysis": {
+        "faces_detected": 0,
+        "emotions": [],
+        "labels": [],
+        "confidence_indicators": []
+    }
+}
+
+
+def _default_section(name: str) -> Dict[str, Any]:
+    """Copy of a default analysis section, safe for the caller to mutate."""
+    return copy.deepcopy(_DEFAULT_ANALYSIS[name])
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an upload in fixed-size chunks."""
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        yield chunk
+
+
+async def _remove_video_file(path: str):
+    """Delete a saved upload, ignoring one that is already gone."""
+    try:
+        await aiofiles.os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _release_video_file(video_data: Dict[str, Any]):
+    """Delete a stored upload once its analysis has been kept."""
+    path = video_data.pop("path", None)
+    if path:
+        await _remove_video_file(path)
+
+
+async def _expire_unanalyzed_videos():
+    """Delete saved uploads nobody analyzed within UNANALYZED_VIDEO_TTL_SECONDS."""
+    cutoff = time.time() - UNANALYZED_VIDEO_TTL_SECONDS
+    for video_data in list(_video_storage.values()):
+        if "path" in video_data and not video_data.get("analyzing") and video_data["uploaded_at"] < cutoff:
+            await _release_video_file(video_data)
+
+
+async def _analyze_stored_video(service: Any, video_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze a stored upload, keep the result and delete the saved file.
+    
+    On failure the file is kept for a retry through /video/analyze until
+    it expires; `analyzing` stops the expiry sweep deleting it mid-run.
+    """
+    video_data["analyzing"] = True
+    try:
+        analysis = await service.analyze_video_file(
+            video_path=video_data["path"],
+            digest=video_data["digest"],
+            startup_id=video_data["startup_id"],
+            filename=video_data["filename"]
+        )
+    finally:
+        video_data.pop("analyzing", None)
+    video_data["analysis"] = analysis
+    await _release_video_file(video_data)
+    return analysis
+
+
+def _transcript_preview(transcript: Optional[str], max_chars: int) -> str:
+    """Truncated transcript for UI display."""
+    if not transcript:
+        return "No speech detected"
+    return transcript[:max_chars] + "..."
+
 
 # Helper functions for UI-friendly metrics
 def _get_grade(score: float) -> str:
@@ -91,6 +195,11 @@ async def upload_pitch_video(
     """
     logger.info(f"Uploading video for {startup_id}: {file.filename}")
     
+    await _expire_unanalyzed_videos()
+    
+    video_path = None
+    video_id = None
+    accepted = False
     try:
         # Validate file type
         logger.info(f"File content type: {file.content_type}")
@@ -99,27 +208,32 @@ async def upload_pitch_video(
             if not file.filename or not file.filename.lower().endswith(('.mp4', '.mov', '.avi', '.mkv', '.webm')):
                 raise HTTPException(400, f"File must be a video. Detected type: {file.content_type}, filename: {file.filename}")
         
-        # Read video content
-        content = await file.read()
-        size_mb = len(content) / (1024 * 1024)
-        
-        if size_mb > 100:  # 100MB limit for hackathon
+        # Stream the upload to disk rather than holding the whole video in memory
+        service = get_video_service()
+        try:
+            video_path, digest, size = await service.save_video_stream(
+                _iter_upload(file), file.filename, max_bytes=MAX_VIDEO_BYTES
+            )
+        except ValueError:
             raise HTTPException(400, "Video must be under 100MB")
+        size_mb = size / (1024 * 1024)
         
         # Generate video ID and startup_id if not provided
         if not startup_id:
             import hashlib
-            from datetime import datetime
-            startup_id = f"video_{hashlib.md5(file.filename.encode()).hexdigest()[:8]}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            from datetime import datetime, timezone
+            startup_id = f"video_{hashlib.blake2b(file.filename.encode(), digest_size=4).hexdigest()}_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
         
         video_id = f"{startup_id}-video-{hash(file.filename)}"
         
-        # Store video (in memory for hackathon)
+        # Keep the saved file until it has been analyzed
         # In production, upload to GCS
         _video_storage[video_id] = {
-            "content": content,
+            "path": video_path,
+            "digest": digest,
             "filename": file.filename,
-            "startup_id": startup_id
+            "startup_id": startup_id,
+            "uploaded_at": time.time()
         }
         
         # For demo: Analyze immediately if video is small enough
@@ -127,14 +241,7 @@ async def upload_pitch_video(
         if size_mb < 10:  # Auto-analyze videos under 10MB
             try:
                 logger.info(f"Auto-analyzing video {video_id} ({size_mb:.1f} MB)")
-                service = get_video_service()
-                analysis_result = await service.analyze_video(
-                    video_content=content,
-                    startup_id=startup_id,
-                    filename=file.filename
-                )
-                # Store analysis for later retrieval
-                _video_storage[video_id]["analysis"] = analysis_result
+                analysis_result = await _analyze_stored_video(service, _video_storage[video_id])
             except Exception as e:
                 logger.warning(f"Auto-analysis failed: {e}")
         
@@ -152,7 +259,7 @@ async def upload_pitch_video(
             response.analysis = {
                 "processed_with": analysis_result.get("processed_with", "Unknown"),
                 "timestamp": analysis_result.get("timestamp"),
-                "transcript": analysis_result.get("transcript", "")[:200] + "..." if analysis_result.get("transcript") else "No speech detected",
+                "transcript": _transcript_preview(analysis_result.get("transcript"), 200),
                 "founder_analysis": result.get("founder_analysis", {}),
                 "sentiment_analysis": result.get("sentiment_analysis", {}),
                 "content_analysis": result.get("content_quality", result.get("content_analysis", {})),
@@ -201,11 +308,20 @@ async def upload_pitch_video(
                 }
             }
         
+        accepted = True
         return response
         
     except Exception as e:
         logger.error(f"Video upload failed: {e}")
         raise HTTPException(500, f"Upload failed: {str(e)}")
+    finally:
+        if not accepted:
+            # Failed or cancelled before the client got a video_id, so
+            # nothing can analyze the saved file
+            if video_id:
+                _video_storage.pop(video_id, None)
+            if video_path:
+                await _remove_video_file(video_path)
 
 
 class VideoAnalyzeRequest(BaseModel):
@@ -242,65 +358,28 @@ async def analyze_pitch_video(
         if "analysis" in video_data:
             logger.info(f"Using cached analysis for video {video_id}")
             analysis = video_data["analysis"]
+        elif "path" not in video_data:
+            raise HTTPException(410, "Video expired before it was analyzed; please upload it again")
         else:
             # Analyze with video service (only if not already done)
             logger.info(f"Running new analysis for video {video_id}")
-            service = get_video_service()
-            analysis = await service.analyze_video(
-                video_content=video_data["content"],
-                startup_id=video_data["startup_id"],
-                filename=video_data["filename"]
-            )
-            # Store analysis for future use
-            video_data["analysis"] = analysis
+            analysis = await _analyze_stored_video(get_video_service(), video_data)
         
         # Extract analysis components and ensure consistent structure
         result = analysis.get("analysis", {})
         
-        # Build safe defaults if sections are missing
-        def _defaults():
-            return {
-                "founder_analysis": {
-                    "confidence_score": 0.5,
-                    "communication_clarity": 0.5,
-                    "technical_depth": 0.5,
-                    "passion_score": 0.5,
-                    "authenticity": 0.5
-                },
-                "sentiment_analysis": {
-                    "overall_sentiment": "neutral",
-                    "confidence": 0.5,
-                    "key_emotions": ["professional"]
-                },
-                "content_quality": {
-                    "problem_articulation": 0.5,
-                    "solution_clarity": 0.5,
-                    "market_understanding": 0.5
-                },
-                "investment_signals": {
-                    "founder_quality": 0.5,
-                    "recommended_action": "pass",
-                    "key_strengths": ["Professional appearance"],
-                    "concerns": ["Needs more clarity"]
-                },
-                "visual_analysis": {
-                    "faces_detected": 0,
-                    "emotions": [],
-                    "labels": [],
-                    "confidence_indicators": []
-                }
-            }
-        d = _defaults()
-        
-        founder_analysis = result.get("founder_analysis") or d["founder_analysis"]
-        sentiment_analysis = result.get("sentiment_analysis") or d["sentiment_analysis"]
+        # Fall back to neutral defaults for missing sections
+        founder_analysis = result.get("founder_analysis") or _default_section("founder_analysis")
+        sentiment_analysis = result.get("sentiment_analysis") or _default_section("sentiment_analysis")
         # prefer content_quality then fallback to content_analysis then defaults
-        content_analysis = result.get("content_quality") or result.get("content_analysis") or d["content_quality"]
-        investment_signals = result.get("investment_signals") or d["investment_signals"]
-        visual_analysis = analysis.get("visual_analysis") or result.get("visual_analysis") or d["visual_analysis"]
+        content_analysis = result.get("content_quality") or result.get("content_analysis") or _default_section("content_quality")
+        investment_signals = result.get("investment_signals") or _default_section("investment_signals")
+        visual_analysis = analysis.get("visual_analysis") or result.get("visual_analysis") or _default_section("visual_analysis")
         
-        # Get transcript for context
-        transcript = analysis.get("transcript", "")
+        # Quote the transcript only when Gemini returned no key quotes
+        key_quotes = result.get("key_quotes")
+        if key_quotes is None:
+            key_quotes = [_transcript_preview(analysis.get("transcript"), 100)]
         
         # Create UI-friendly response with calculated metrics
         response_data = {
@@ -312,7 +391,7 @@ async def analyze_pitch_video(
             "investment_signals": investment_signals,
             "red_flags": result.get("red_flags", []),
             "green_flags": result.get("green_flags", []),
-            "key_quotes": result.get("key_quotes", [transcript[:100] + "..." if transcript else "No speech detected"]),
+            "key_quotes": key_quotes,
             "visual_analysis": visual_analysis,
             
             # Add UI-ready metrics
@@ -368,6 +447,31 @@ async def analyze_pitch_video(
         raise HTTPException(500, f"Video analysis failed: {str(e)}")
 
 
+@router.get("/video/{startup_id}/status")
+async def get_video_status(
+    startup_id: str,
+    api_key: str = Depends(verify_api_key)
+) -> Dict[str, Any]:
+    """Report a startup's uploaded videos and pending annotations.
+    
+    Lets the client poll for long-running analysis instead of holding a
+    request open until it finishes.
+    """
+    videos = [
+        {"video_id": video_id, "filename": data["filename"], "analyzed": "analysis" in data}
+        for video_id, data in _video_storage.items()
+        if data["startup_id"] == startup_id
+    ]
+    annotations = get_video_service().annotate_status(startup_id)
+    
+    return {
+        "startup_id": startup_id,
+        "videos": videos,
+        "annotations": annotations,
+        "pending": any(not a["done"] for a in annotations)
+    }
+
+
 # Removed redundant insights endpoint - all data available via /v1/video/analyze
 
 
@@ -50,10 +50,21 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     CHUNK_SIZE: int = 512  # tokens per chunk
     CHUNK_OVERLAP: int = 50  # overlap between chunks
+    EASYOCR_MODEL_DIR: Optional[str] = None  # Shared weights dir; None uses ~/.EasyOCR
+    MAX_PARSE_CONCURRENCY: int = 4  # documents parsed at once per process (memory bound)
+    CACHE_DIR: str = "data/cache"  # on-disk caches (e.g. parsed document text)
+    PDF_PRESERVE_READING_ORDER: bool = False  # sort PDF text blocks (slower) for full-text extraction
+    VIDEO_TRANSCRIPT: bool = False  # transcribe pitch videos alongside the Gemini frame analysis
+    VIDEO_TRANSCRIPT_LABELS: bool = False  # use full Video Intelligence (labels + speech) instead of audio-only Speech-to-Text
+    VIDEO_TRANSCRIPT_LOCAL: bool = False  # transcribe on CPU with faster-whisper instead of Google Cloud
+    WHISPER_MODEL: str = "base.en"
+    VIDEO_INTELLIGENCE_LOCATION: str = "us-east1"  # regional VI endpoint; empty for the global one
     
     # Retrieval Settings
     VECTOR_K: int = 8  # top-k for vector search
     BM25_K: int = 8  # top-k for BM25 search
+    RETRIEVAL_FUSION: str = "rrf"  # "rrf" (reciprocal rank fusion) or "ws" (weighted score sum)
+    RRF_K: int = 60  # rank offset for reciprocal rank fusion
     
     # Scoring Thresholds
     INVEST_THRESHOLD: float = 0.75
@@ -72,6 +83,10 @@ class Settings(BaseSettings):
     NEO4J_URI: Optional[str] = None
     NEO4J_USERNAME: Optional[str] = None
     NEO4J_PASSWORD: Optional[str] = None
+    NEO4J_DATABASE: Optional[str] = None  # None uses the server's default database
+    NEO4J_USE_GDS: bool = False  # Batch KNN similarity (needs Graph Data Science plugin)
+    NEO4J_MAX_POOL_SIZE: int = 50
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 30.0  # seconds
     
     @property
     def is_production(self) -> bool:
@@ -86,7 +86,22 @@ def generate_chunk_id(document_id: str, chunk_index: int) -> str:
     Returns:
         Unique chunk ID
     """
-    return f"{document_id}-chunk-{chunk_index:04d}"
+    return f"{chunk_id_prefix(document_id)}{chunk_index:04d}"
+
+
+def chunk_id_prefix(document_id: str) -> str:
+    """Get the part of a chunk ID shared by every chunk of a document.
+    
+    Lets callers emitting many chunks build the prefix once and append
+    the zero-padded index per chunk.
+    
+    Args:
+        document_id: Parent document ID
+        
+    Returns:
+        Chunk ID prefix
+    """
+    return f"{document_id}-chunk-"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -35,10 +35,21 @@ async def lifespan(app: FastAPI):
     logger.info(f"BigQuery: {'Enabled' if settings.USE_BIGQUERY else 'Disabled'}")
     logger.info(f"Matching Engine: {'Enabled' if settings.USE_MATCHING_ENGINE else 'Disabled'}")
     
+    if not settings.USE_VERTEX:
+        # Image OCR runs on EasyOCR locally; load its weights in the background
+        # so health checks don't wait on the model (or its first download)
+        from .services.parsers import start_ocr_warmup
+        start_ocr_warmup()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down AnalystAI Backend")
+    try:
+        from .services.neo4j_graph import close_knowledge_graph
+        await close_knowledge_graph()
+    except ImportError:
+        pass
 
 
 # Create FastAPI app
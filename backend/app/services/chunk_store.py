@@ -11,16 +11,23 @@ logger = get_logger(__name__)
 # Simple in-memory storage
 _chunk_storage: Dict[str, List[Chunk]] = {}
 
+CHUNK_STORAGE_DIR = Path("storage/chunks")
+
+
+def chunk_file_path(startup_id: str) -> Path:
+    """Get the on-disk path of a startup's stored chunks."""
+    return CHUNK_STORAGE_DIR / f"{startup_id}.pkl"
+
+
 def store_chunks(startup_id: str, chunks: List[Chunk]) -> None:
     """Store chunks for a startup."""
     global _chunk_storage
     _chunk_storage[startup_id] = chunks
     
     # Also persist to disk
-    storage_dir = Path("storage/chunks")
-    storage_dir.mkdir(parents=True, exist_ok=True)
+    CHUNK_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
     
-    file_path = storage_dir / f"{startup_id}.pkl"
+    file_path = chunk_file_path(startup_id)
     try:
         with open(file_path, 'wb') as f:
             pickle.dump(chunks, f)
@@ -37,8 +44,7 @@ def get_chunks(startup_id: str) -> List[Chunk]:
         return _chunk_storage[startup_id]
     
     # Try loading from disk
-    storage_dir = Path("storage/chunks")
-    file_path = storage_dir / f"{startup_id}.pkl"
+    file_path = chunk_file_path(startup_id)
     
     if file_path.exists():
         try:
@@ -57,7 +63,6 @@ def clear_chunks(startup_id: str) -> None:
     if startup_id in _chunk_storage:
         del _chunk_storage[startup_id]
     
-    storage_dir = Path("storage/chunks")
-    file_path = storage_dir / f"{startup_id}.pkl"
+    file_path = chunk_file_path(startup_id)
     if file_path.exists():
         file_path.unlink()
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Google Cloud Storage service for file management."""
 
 import io
+import os
+import asyncio
 import base64
 from typing import Optional, Tuple
 from pathlib import Path
@@ -12,6 +14,11 @@ from ..core.security import sanitize_filename, hash_content
 
 logger = get_logger(__name__)
 
+# Files above this are uploaded as concurrent XML multipart parts
+MULTIPART_THRESHOLD_BYTES = 32 * 1024 * 1024
+MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 8
+
 
 class GCSService:
     """Google Cloud Storage service."""
@@ -109,6 +116,61 @@ class GCSService:
             logger.info(f"Saved file locally: {local_path}")
             return str(local_path), f"file://{local_path}"
     
+    async def upload_path(
+        self,
+        local_path: str,
+        storage_path: str,
+        content_type: Optional[str] = None
+    ) -> Optional[str]:
+        """Stream a local file to GCS without reading it into memory.
+        
+        Args:
+            local_path: Path of the file to upload
+            storage_path: Destination object name in the bucket
+            content_type: MIME type
+            
+        Returns:
+            gs:// URI of the uploaded object, or None when GCS is not configured
+        """
+        if not (self.client and self.bucket):
+            return None
+        
+        try:
+            blob = self.bucket.blob(storage_path)
+            if os.path.getsize(local_path) > MULTIPART_THRESHOLD_BYTES:
+                await asyncio.to_thread(
+                    self._upload_multipart, local_path, blob, content_type
+                )
+            else:
+                await asyncio.to_thread(
+                    blob.upload_from_filename,
+                    local_path,
+                    content_type=content_type or 'application/octet-stream'
+                )
+            logger.info(f"Uploaded file to GCS: {storage_path}")
+            return f"gs://{self.bucket_name}/{storage_path}"
+            
+        except Exception as e:
+            logger.error(f"GCS upload failed: {str(e)}")
+            raise ExternalServiceError("GCS", f"Upload failed: {str(e)}")
+    
+    def _upload_multipart(self, local_path: str, blob, content_type: Optional[str] = None):
+        """Upload a large file as concurrent parts (blocking).
+        
+        A single PUT is limited by one connection's throughput; the XML
+        multipart API lets several part uploads run in parallel.
+        """
+        from google.cloud.storage import transfer_manager
+        
+        transfer_manager.upload_chunks_concurrently(
+            local_path,
+            blob,
+            content_type=content_type or 'application/octet-stream',
+            chunk_size=MULTIPART_CHUNK_BYTES,
+            worker_type=transfer_manager.THREAD,
+            max_workers=MULTIPART_MAX_WORKERS
+        )
+    
     async def download_file(self, storage_path: str) -> bytes:
         """Download file from GCS.
         
@@ -1,35 +1,172 @@
 """Neo4j Knowledge Graph for Startup Relationships."""
 
-from typing import Dict, List, Optional, Any
-from neo4j import GraphDatabase, AsyncGraphDatabase
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+from neo4j import GraphDatabase, AsyncGraphDatabase, RoutingControl, READ_ACCESS
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
 import asyncio
 import json
+import time
 from ..core.config import get_settings
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on peers scored per insert by the similarity pass
+SIMILARITY_CANDIDATE_LIMIT = 200
+
+# Portfolio names returned per investor by the investor network query
+INVESTOR_PORTFOLIO_LIMIT = 10
+
+# Read-path cache: graph changes slowly relative to polling of these endpoints
+READ_CACHE_TTL_SECONDS = 60
+READ_CACHE_MAX_ENTRIES = 2048
+
+# Constraints/indexes backing the MERGE keys and candidate filters
+SCHEMA_STATEMENTS = (
+    "CREATE CONSTRAINT startup_id IF NOT EXISTS FOR (s:Startup) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT investor_name IF NOT EXISTS FOR (i:Investor) REQUIRE i.name IS UNIQUE",
+    "CREATE CONSTRAINT market_name IF NOT EXISTS FOR (m:Market) REQUIRE m.name IS UNIQUE",
+    "CREATE CONSTRAINT technology_name IF NOT EXISTS FOR (t:Technology) REQUIRE t.name IS UNIQUE",
+    "CREATE CONSTRAINT funding_stage_name IF NOT EXISTS FOR (f:FundingStage) REQUIRE f.name IS UNIQUE",
+    "CREATE CONSTRAINT location_name IF NOT EXISTS FOR (l:Location) REQUIRE l.name IS UNIQUE",
+    "CREATE INDEX startup_industry IF NOT EXISTS FOR (s:Startup) ON (s.industry)",
+    "CREATE INDEX startup_funding_stage IF NOT EXISTS FOR (s:Startup) ON (s.funding_stage)",
+    "CREATE INDEX startup_industry_stage IF NOT EXISTS FOR (s:Startup) ON (s.industry, s.funding_stage)",
+)
+
+# Fields where a zero value historically meant "not provided"
+_ZERO_MEANS_UNSET = frozenset({"runway_months", "gross_margin", "founded", "ltv_cac_ratio"})
+
+
+class StartupNodeProps(BaseModel):
+    """Typed Startup node properties, coerced in a single validation pass."""
+    
+    model_config = ConfigDict(extra="ignore")
+    
+    name: Optional[str] = Field(None, validation_alias="company_name")
+    display_name: str = Field("Unknown", validation_alias="company_name")
+    industry: str = "Technology"
+    sub_industry: str = "SaaS"
+    business_model: str = "B2B"
+    arr: float = 0.0
+    growth_rate: float = 0.0
+    burn_rate: float = 0.0
+    runway_months: int = 18
+    gross_margin: float = 75.0
+    founded: int = 2020
+    team_size: int = 0
+    customer_count: int = 0
+    ltv_cac_ratio: float = 3.0
+    funding_stage: str = "Seed"
+    total_raised: float = 0.0
+    valuation: float = 0.0
+    headquarters: str = "US"
+    markets: List[str] = ["Global"]
+    technologies: List[str] = ["AI", "ML"]
+    data_completeness: float = 0.7
+    analysis_confidence: float = 0.8
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_unset(cls, data: Any) -> Any:
+        """Let empty values fall back to defaults, as `value or default` did."""
+        if not isinstance(data, dict):
+            return data
+        return {
+            k: v for k, v in data.items()
+            if v is not None and v != "" and not (k in _ZERO_MEANS_UNSET and v == 0)
+        }
+    
+    @field_validator("runway_months", "founded", "team_size", "customer_count", mode="before")
+    @classmethod
+    def _truncate_float(cls, value: Any) -> Any:
+        """Truncate fractional counts (e.g. 12.5 team members) as int() did."""
+        if isinstance(value, float):
+            return int(value)
+        return value
+
 
 class StartupKnowledgeGraph:
     """Neo4j-based knowledge graph for startup ecosystem analysis."""
     
     def __init__(self):
-        """Initialize Neo4j connection."""
+        """Initialize graph state; the driver is created by connect()."""
         self.settings = get_settings()
         self.driver = None
+        self._schema_ready = False
+        self._read_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+    
+    async def connect(self):
+        """Create the async driver inside the running event loop and verify it.
         
+        The driver binds its Bolt sockets to the loop it is created on, so this
+        must run under the serving loop (uvloop under uvicorn), not at import.
+        """
         # Only initialize if Neo4j is configured
-        if self.settings.NEO4J_URI:
-            try:
-                # Use the configured username (instance ID for Aura Free)
-                self.driver = AsyncGraphDatabase.driver(
-                    self.settings.NEO4J_URI,
-                    auth=(self.settings.NEO4J_USERNAME, self.settings.NEO4J_PASSWORD)
-                )
-                logger.info("Neo4j Knowledge Graph initialized")
-            except Exception as e:
-                logger.warning(f"Neo4j not available: {e}")
-                self.driver = None
+        if self.driver or not self.settings.NEO4J_URI:
+            return
+        
+        try:
+            # Use the configured username (instance ID for Aura Free)
+            driver = AsyncGraphDatabase.driver(
+                self.settings.NEO4J_URI,
+                auth=(self.settings.NEO4J_USERNAME, self.settings.NEO4J_PASSWORD),
+                max_connection_pool_size=self.settings.NEO4J_MAX_POOL_SIZE,
+                connection_acquisition_timeout=self.settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+            )
+            await driver.verify_connectivity()
+        except Exception as e:
+            logger.warning(f"Neo4j not available: {e}")
+            return
+        
+        self.driver = driver
+        logger.info("Neo4j Knowledge Graph initialized")
+        await self._ensure_schema()
+    
+    async def _ensure_schema(self):
+        """Create constraints/indexes so lookups and MERGEs use index seeks.
+        
+        Runs once per instance, after connect() has verified connectivity.
+        """
+        if self._schema_ready or not self.driver:
+            return
+        
+        async with self.driver.session(database=self.settings.NEO4J_DATABASE) as session:
+            for statement in SCHEMA_STATEMENTS:
+                try:
+                    await session.run(statement)
+                except Exception as e:
+                    logger.warning(f"Failed to apply graph schema statement: {e}")
+        self._schema_ready = True
+        logger.info("Neo4j schema constraints and indexes ensured")
+    
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """Return a cached read result if it has not expired."""
+        entry = self._read_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._read_cache[key]
+            return None
+        return entry[1]
+    
+    def _cache_set(self, key: Tuple[Any, ...], value: Any):
+        """Cache a read result, evicting the oldest entry when full."""
+        if len(self._read_cache) >= READ_CACHE_MAX_ENTRIES:
+            self._read_cache.pop(next(iter(self._read_cache)))
+        self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL_SECONDS, value)
+    
+    def _invalidate_read_cache(self):
+        """Drop cached reads; writes can add edges touching any startup."""
+        self._read_cache.clear()
+    
+    @staticmethod
+    def _coerce_props(startup_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Startup node property map in one typed validation pass."""
+        props = StartupNodeProps.model_validate(data).model_dump()
+        if props["name"] is None:
+            props["name"] = startup_id
+        return props
     
     async def create_startup_node(
         self,
@@ -40,38 +177,11 @@ class StartupKnowledgeGraph:
         if not self.driver:
             return False
             
-        # Extract all available metrics for comprehensive node
-        arr = data.get('arr', 0)
-        growth_rate = data.get('growth_rate', 0)
-        burn_rate = data.get('burn_rate', 0)
-        team_size = data.get('team_size', 0)
-        
         # Professional node creation with all attributes
         query = """
         MERGE (s:Startup {id: $startup_id})
-        SET s.name = $name,
-            s.display_name = $display_name,
-            s.industry = $industry,
-            s.sub_industry = $sub_industry,
-            s.business_model = $business_model,
-            s.arr = $arr,
-            s.growth_rate = $growth_rate,
-            s.burn_rate = $burn_rate,
-            s.runway_months = $runway_months,
-            s.gross_margin = $gross_margin,
-            s.founded = $founded,
-            s.team_size = $team_size,
-            s.customer_count = $customer_count,
-            s.ltv_cac_ratio = $ltv_cac_ratio,
-            s.funding_stage = $funding_stage,
-            s.total_raised = $total_raised,
-            s.valuation = $valuation,
-            s.headquarters = $headquarters,
-            s.markets = $markets,
-            s.technologies = $technologies,
-            s.updated_at = timestamp(),
-            s.data_completeness = $data_completeness,
-            s.analysis_confidence = $analysis_confidence
+        SET s += $props,
+            s.updated_at = timestamp()
         
         // Calculate derived metrics
         WITH s
@@ -84,41 +194,48 @@ class StartupKnowledgeGraph:
             ELSE s.growth_rate
         END
         
-        RETURN s
+        // Normalized feature vector for GDS KNN similarity
+        WITH s
+        SET s.feature_vec = [
+            log10(s.arr + 1) / 7.0,
+            s.growth_rate / 100.0,
+            CASE WHEN s.efficiency_score > 2.0 THEN 2.0 ELSE s.efficiency_score END,
+            CASE s.funding_stage
+                WHEN 'Pre-Seed' THEN 0.0
+                WHEN 'Seed' THEN 0.2
+                WHEN 'Series A' THEN 0.4
+                WHEN 'Series B' THEN 0.6
+                WHEN 'Series C' THEN 0.8
+                ELSE 1.0
+            END
+        ]
+        
+        // Count-store lookup: lets the caller skip peer queries on an empty graph
+        RETURN COUNT { (:Startup) } AS startup_count
         """
         
-        async with self.driver.session() as session:
+        try:
+            props = self._coerce_props(startup_id, data)
+        except ValidationError as e:
+            logger.error(f"Invalid startup data for {startup_id}: {e}")
+            return False
+        
+        await self._ensure_schema()
+        
+        async def _write_node(tx):
+            result = await tx.run(query, startup_id=startup_id, props=props)
+            record = await result.single()
+            
+            # Relationships share the node's transaction: one commit, no orphans.
+            # Without any other Startup there is nothing to relate to.
+            if record and record["startup_count"] > 1:
+                await self._create_advanced_relationships(tx, startup_id, data)
+        
+        async with self.driver.session(database=self.settings.NEO4J_DATABASE) as session:
             try:
-                # Professional parameter mapping with comprehensive data
-                await session.run(
-                    query,
-                    startup_id=startup_id,
-                    name=data.get('company_name', startup_id),
-                    display_name=data.get('company_name', 'Unknown'),
-                    industry=data.get('industry', 'Technology'),
-                    sub_industry=data.get('sub_industry', 'SaaS'),
-                    business_model=data.get('business_model', 'B2B'),
-                    arr=float(data.get('arr') or 0),
-                    growth_rate=float(data.get('growth_rate') or 0),
-                    burn_rate=float(data.get('burn_rate') or 0),
-                    runway_months=int(data.get('runway_months') or 18),
-                    gross_margin=float(data.get('gross_margin') or 75),
-                    founded=int(data.get('founded') or 2020),
-                    team_size=int(data.get('team_size') or 0),
-                    customer_count=int(data.get('customer_count') or 0),
-                    ltv_cac_ratio=float(data.get('ltv_cac_ratio') or 3),
-                    funding_stage=data.get('funding_stage', 'Seed'),
-                    total_raised=float(data.get('total_raised') or 0),
-                    valuation=float(data.get('valuation') or 0),
-                    headquarters=data.get('headquarters', 'US'),
-                    markets=data.get('markets', ['Global']),
-                    technologies=data.get('technologies', ['AI', 'ML']),
-                    data_completeness=float(data.get('data_completeness', 0.7)),
-                    analysis_confidence=float(data.get('analysis_confidence', 0.8))
-                )
-                
-                # Create advanced relationships after node creation
-                await self._create_advanced_relationships(session, startup_id, data)
+                await session.execute_write(_write_node)
+                await self._create_ecosystem_relationships(session, startup_id)
+                self._invalidate_read_cache()
                 
                 logger.info(f"Created professional startup node with advanced relationships: {startup_id}")
                 return True
@@ -126,14 +243,25 @@ class StartupKnowledgeGraph:
                 logger.error(f"Failed to create startup node: {e}")
                 return False
     
-    async def _create_advanced_relationships(self, session, startup_id: str, data: Dict[str, Any]):
-        """Create sophisticated graph relationships using multiple algorithms."""
+    async def _create_advanced_relationships(self, tx, startup_id: str, data: Dict[str, Any]):
+        """Create similarity and competition relationships inside a write transaction.
+        
+        With NEO4J_USE_GDS enabled, SIMILAR_TO edges come from the batch KNN job
+        (refresh_similarity_relationships) and the per-insert pass is skipped.
+        """
         
         # 1. Similarity relationships with multi-factor scoring
         similarity_query = """
         MATCH (s:Startup {id: $startup_id})
+        
+        // Narrow candidates via the industry index before scoring
         MATCH (other:Startup)
-        WHERE other.id <> s.id
+        USING INDEX other:Startup(industry)
+        WHERE other.industry = s.industry
+          AND other.id <> s.id
+          AND abs(log10(s.arr + 1) - log10(other.arr + 1)) < 1.5
+        WITH s, other
+        LIMIT $candidate_limit
         
         // Calculate multi-dimensional similarity
         WITH s, other,
@@ -188,25 +316,45 @@ class StartupKnowledgeGraph:
             sim.updated_at = timestamp()
         """
         
-        try:
-            await session.run(similarity_query, startup_id=startup_id)
-        except Exception as e:
-            logger.error(f"Failed to create similarity relationships: {e}")
+        if not self.settings.NEO4J_USE_GDS:
+            result = await tx.run(
+                similarity_query,
+                startup_id=startup_id,
+                candidate_limit=SIMILARITY_CANDIDATE_LIMIT
+            )
+            await result.consume()
         
         # 2. Competitive relationships with intensity scoring
         competition_query = """
         MATCH (s:Startup {id: $startup_id})
-        MATCH (competitor:Startup)
+        
+        // One branch per competition signal so each uses its own index seek
+        // instead of a label scan filtered by an OR predicate
+        CALL {
+            // Direct competition: similar ARR range
+            WITH s
+            MATCH (competitor:Startup)
+            USING INDEX competitor:Startup(industry)
+            WHERE competitor.industry = s.industry
+              AND competitor.arr > s.arr * 0.5 AND competitor.arr < s.arr * 2.0
+            RETURN competitor
+            UNION
+            // Market overlap (s's own OPERATES_IN edges are written after this)
+            WITH s
+            UNWIND s.markets AS market_name
+            MATCH (:Market {name: market_name})<-[:OPERATES_IN]-(competitor:Startup)
+            WHERE competitor.industry = s.industry
+            RETURN competitor
+            UNION
+            // Technology overlap
+            WITH s
+            UNWIND s.technologies AS tech_name
+            MATCH (:Technology {name: tech_name})<-[:USES]-(competitor:Startup)
+            WHERE competitor.industry = s.industry
+            RETURN competitor
+        }
+        WITH s, competitor
         WHERE competitor.id <> s.id
-          AND competitor.industry = s.industry
-          AND (
-              // Direct competition: similar ARR range
-              (competitor.arr > s.arr * 0.5 AND competitor.arr < s.arr * 2.0) OR
-              // Market overlap
-              size([m IN s.markets WHERE m IN competitor.markets]) > 0 OR
-              // Technology overlap
-              size([t IN s.technologies WHERE t IN competitor.technologies]) > 0
-          )
         
         WITH s, competitor,
              size([m IN s.markets WHERE m IN competitor.markets]) as market_overlap,
@@ -234,37 +382,105 @@ class StartupKnowledgeGraph:
             comp.updated_at = timestamp()
         """
         
-        try:
-            await session.run(competition_query, startup_id=startup_id)
-        except Exception as e:
-            logger.error(f"Failed to create competitive relationships: {e}")
+        result = await tx.run(competition_query, startup_id=startup_id)
+        await result.consume()
+    
+    async def _create_ecosystem_relationships(self, session, startup_id: str):
+        """Create market and ecosystem relationships in batched sub-transactions.
         
-        # 3. Market and ecosystem relationships
+        CALL { ... } IN TRANSACTIONS releases Market/Technology locks per batch
+        but is only valid in an auto-commit transaction, so this runs through
+        session.run rather than the node's write transaction.
+        """
         ecosystem_query = """
         MATCH (s:Startup {id: $startup_id})
-        WITH s
         UNWIND s.markets as market_name
-        MERGE (m:Market {name: market_name})
-        MERGE (s)-[op:OPERATES_IN]->(m)
-        SET op.primary = (market_name = s.markets[0])
-        WITH s
+        CALL {
+            WITH s, market_name
+            MERGE (m:Market {name: market_name})
+            MERGE (s)-[op:OPERATES_IN]->(m)
+            SET op.primary = (market_name = s.markets[0])
+        } IN TRANSACTIONS OF 500 ROWS
+        WITH DISTINCT s
         UNWIND s.technologies as tech_name
-        MERGE (t:Technology {name: tech_name})
-        MERGE (s)-[uses:USES]->(t)
-        SET uses.core = (tech_name IN ['AI', 'ML', 'Blockchain'])
-        WITH s
-        MERGE (stage:FundingStage {name: s.funding_stage})
-        MERGE (s)-[:AT_STAGE]->(stage)
-        WITH s
-        MERGE (loc:Location {name: s.headquarters})
-        MERGE (s)-[:HEADQUARTERED_IN]->(loc)
+        CALL {
+            WITH s, tech_name
+            MERGE (t:Technology {name: tech_name})
+            MERGE (s)-[uses:USES]->(t)
+            SET uses.core = (tech_name IN ['AI', 'ML', 'Blockchain'])
+        } IN TRANSACTIONS OF 500 ROWS
+        WITH DISTINCT s
+        CALL {
+            WITH s
+            MERGE (stage:FundingStage {name: s.funding_stage})
+            MERGE (s)-[:AT_STAGE]->(stage)
+            MERGE (loc:Location {name: s.headquarters})
+            MERGE (s)-[:HEADQUARTERED_IN]->(loc)
+        } IN TRANSACTIONS
         """
         
         try:
-            await session.run(ecosystem_query, startup_id=startup_id)
+            result = await session.run(ecosystem_query, startup_id=startup_id)
+            # Errors in the batched sub-transactions only surface once consumed
+            await result.consume()
         except Exception as e:
             logger.error(f"Failed to create ecosystem relationships: {e}")
     
+    async def refresh_similarity_relationships(self, top_k: int = 10) -> bool:
+        """Rebuild SIMILAR_TO edges for all startups with one GDS KNN pass.
+        
+        Requires the Graph Data Science plugin. Cosine similarity over
+        `feature_vec` replaces the per-insert multi-factor Cypher scoring.
+        """
+        if not self.driver:
+            return False
+        
+        graph_name = "startup-similarity"
+        
+        async with self.driver.session(database=self.settings.NEO4J_DATABASE) as session:
+            try:
+                await session.run("CALL gds.graph.drop($graph_name, false)", graph_name=graph_name)
+                await session.run(
+                    """
+                    CALL gds.graph.project($graph_name, {
+                        Startup: {properties: {feature_vec: {defaultValue: [0.0, 0.0, 0.0, 0.0]}}}
+                    }, '*')
+                    """,
+                    graph_name=graph_name
+                )
+                
+                # knn.write creates edges rather than merging them
+                await session.run(
+                    """
+                    MATCH ()-[r:SIMILAR_TO]->()
+                    CALL { WITH r DELETE r } IN TRANSACTIONS OF 10000 ROWS
+                    """
+                )
+                await session.run(
+                    """
+                    CALL gds.knn.write($graph_name, {
+                        nodeProperties: ['feature_vec'],
+                        topK: $top_k,
+                        similarityCutoff: 0.4,
+                        writeRelationshipType: 'SIMILAR_TO',
+                        writeProperty: 'score'
+                    })
+                    """,
+                    graph_name=graph_name,
+                    top_k=top_k
+                )
+                self._invalidate_read_cache()
+                logger.info("Refreshed SIMILAR_TO relationships via GDS KNN")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to refresh similarity relationships: {e}")
+                return False
+            finally:
+                try:
+                    await session.run("CALL gds.graph.drop($graph_name, false)", graph_name=graph_name)
+                except Exception:
+                    pass
+    
     async def create_investor_relationship(
         self,
         startup_id: str,
@@ -274,6 +490,8 @@ class StartupKnowledgeGraph:
         """Create investor relationship."""
         if not self.driver:
             return False
+
+        await self._ensure_schema()
             
         query = """
         MATCH (s:Startup {id: $startup_id})
@@ -285,20 +503,21 @@ class StartupKnowledgeGraph:
         RETURN r
         """
         
-        async with self.driver.session() as session:
-            try:
-                await session.run(
-                    query,
-                    startup_id=startup_id,
-                    investor_name=investor_name,
-                    amount=investment_data.get('amount', 0),
-                    date=investment_data.get('date', ''),
-                    round=investment_data.get('round', 'Seed')
-                )
-                return True
-            except Exception as e:
-                logger.error(f"Failed to create investor relationship: {e}")
-                return False
+        try:
+            await self.driver.execute_query(
+                query,
+                startup_id=startup_id,
+                investor_name=investor_name,
+                amount=investment_data.get('amount', 0),
+                date=investment_data.get('date', ''),
+                round=investment_data.get('round', 'Seed'),
+                database_=self.settings.NEO4J_DATABASE
+            )
+            self._invalidate_read_cache()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create investor relationship: {e}")
+            return False
     
     async def create_competitor_relationship(
         self,
@@ -309,6 +528,8 @@ class StartupKnowledgeGraph:
         """Create competitor relationship based on similarity."""
         if not self.driver:
             return False
+
+        await self._ensure_schema()
             
         query = """
         MATCH (s1:Startup {id: $startup_id})
@@ -318,28 +539,29 @@ class StartupKnowledgeGraph:
         RETURN r
         """
         
-        async with self.driver.session() as session:
-            try:
-                await session.run(
-                    query,
-                    startup_id=startup_id,
-                    competitor_id=competitor_id,
-                    similarity=similarity_score
-                )
-                return True
-            except Exception as e:
-                logger.error(f"Failed to create competitor relationship: {e}")
-                return False
+        try:
+            await self.driver.execute_query(
+                query,
+                startup_id=startup_id,
+                competitor_id=competitor_id,
+                similarity=similarity_score,
+                database_=self.settings.NEO4J_DATABASE
+            )
+            self._invalidate_read_cache()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create competitor relationship: {e}")
+            return False
     
-    async def find_similar_startups(
+    async def iter_similar_startups(
         self,
         startup_id: str,
         limit: int = 5
-    ) -> List[Dict[str, Any]]:
-        """Find similar startups using graph traversal."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream similar startups record by record as the driver fetches them."""
         if not self.driver:
-            return []
-            
+            return
+        
         query = """
         MATCH (s:Startup {id: $startup_id})
         MATCH (s)-[:COMPETES_WITH]-(competitor:Startup)
@@ -351,49 +573,91 @@ class StartupKnowledgeGraph:
         LIMIT $limit
         """
         
-        async with self.driver.session() as session:
-            try:
-                result = await session.run(
-                    query,
-                    startup_id=startup_id,
-                    limit=limit
-                )
-                return [dict(record) async for record in result]
-            except Exception as e:
-                logger.error(f"Failed to find similar startups: {e}")
-                return []
+        async with self.driver.session(
+            database=self.settings.NEO4J_DATABASE,
+            default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(query, startup_id=startup_id, limit=limit)
+            async for record in result:
+                yield dict(record)
     
-    async def find_investor_network(
+    async def find_similar_startups(
         self,
         startup_id: str,
-        depth: int = 2
+        limit: int = 5
     ) -> List[Dict[str, Any]]:
-        """Find investor network up to specified depth."""
+        """Find similar startups using graph traversal."""
         if not self.driver:
             return []
-            
+        
+        cache_key = ("similar", startup_id, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        try:
+            similar = [record async for record in self.iter_similar_startups(startup_id, limit)]
+            self._cache_set(cache_key, similar)
+            return list(similar)
+        except Exception as e:
+            logger.error(f"Failed to find similar startups: {e}")
+            return []
+    
+    async def iter_investor_network(
+        self,
+        startup_id: str,
+        depth: int = 2
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the investor network record by record as the driver fetches them."""
+        if not self.driver:
+            return
+        
+        # Explicit 1- and 2-hop branches instead of a variable-length path, with
+        # LIMIT applied before the portfolio expansion so hub investors are pruned early
         query = """
-        MATCH (s:Startup {id: $startup_id})
-        MATCH path = (s)<-[:INVESTED_IN*1..2]-(investor:Investor)
-        WITH DISTINCT investor
+        CALL {
+            MATCH (:Startup {id: $startup_id})<-[:INVESTED_IN]-(investor:Investor)
+            RETURN investor
+            UNION
+            MATCH (:Startup {id: $startup_id})<-[:INVESTED_IN]-()<-[:INVESTED_IN]-(investor:Investor)
+            WHERE $depth >= 2
+            RETURN investor
+        }
+        WITH investor
+        LIMIT 20
         OPTIONAL MATCH (investor)-[:INVESTED_IN]->(portfolio:Startup)
         WHERE portfolio.id <> $startup_id
         RETURN investor.name as investor,
-               COLLECT(DISTINCT portfolio.name) as portfolio
-        LIMIT 20
+               COLLECT(DISTINCT portfolio.name)[..$portfolio_limit] as portfolio
         """
         
-        async with self.driver.session() as session:
-            try:
-                result = await session.run(
-                    query,
-                    startup_id=startup_id,
-                    depth=depth
-                )
-                return [dict(record) async for record in result]
-            except Exception as e:
-                logger.error(f"Failed to find investor network: {e}")
-                return []
+        async with self.driver.session(
+            database=self.settings.NEO4J_DATABASE,
+            default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(
+                query,
+                startup_id=startup_id,
+                depth=depth,
+                portfolio_limit=INVESTOR_PORTFOLIO_LIMIT
+            )
+            async for record in result:
+                yield dict(record)
+    
+    async def find_investor_network(
+        self,
+        startup_id: str,
+        depth: int = 2
+    ) -> List[Dict[str, Any]]:
+        """Find investor network up to specified depth (1 or 2 hops)."""
+        if not self.driver:
+            return []
+        
+        try:
+            return [record async for record in self.iter_investor_network(startup_id, depth)]
+        except Exception as e:
+            logger.error(f"Failed to find investor network: {e}")
+            return []
     
     async def calculate_market_position(
         self,
@@ -402,6 +666,11 @@ class StartupKnowledgeGraph:
         """Calculate market position based on graph relationships."""
         if not self.driver:
             return {"position": "unknown", "competitors": 0, "investors": 0}
+        
+        cache_key = ("market_position", startup_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
             
         query = """
         MATCH (s:Startup {id: $startup_id})
@@ -415,37 +684,44 @@ class StartupKnowledgeGraph:
                investor_count
         """
         
-        async with self.driver.session() as session:
-            try:
-                result = await session.run(query, startup_id=startup_id)
-                record = await result.single()
+        try:
+            records, _, _ = await self.driver.execute_query(
+                query,
+                startup_id=startup_id,
+                database_=self.settings.NEO4J_DATABASE,
+                routing_=RoutingControl.READ
+            )
+            record = records[0] if records else None
+            
+            if record:
+                data = dict(record)
+                # Calculate position based on metrics
+                position = "challenger"
+                if data['competitor_count'] > 5:
+                    position = "competitive"
+                if data['investor_count'] > 3:
+                    position = "well-funded"
+                if data.get('growth_rate', 0) > 100:
+                    position = "high-growth"
                 
-                if record:
-                    data = dict(record)
-                    # Calculate position based on metrics
-                    position = "challenger"
-                    if data['competitor_count'] > 5:
-                        position = "competitive"
-                    if data['investor_count'] > 3:
-                        position = "well-funded"
-                    if data.get('growth_rate', 0) > 100:
-                        position = "high-growth"
-                    
-                    return {
-                        "position": position,
-                        "competitors": data['competitor_count'],
-                        "investors": data['investor_count'],
-                        "metrics": {
-                            "arr": data.get('arr', 0),
-                            "growth_rate": data.get('growth_rate', 0)
-                        }
+                market_position = {
+                    "position": position,
+                    "competitors": data['competitor_count'],
+                    "investors": data['investor_count'],
+                    "metrics": {
+                        "arr": data.get('arr', 0),
+                        "growth_rate": data.get('growth_rate', 0)
                     }
-                
-                return {"position": "unknown", "competitors": 0, "investors": 0}
-                
-            except Exception as e:
-                logger.error(f"Failed to calculate market position: {e}")
-                return {"position": "error", "competitors": 0, "investors": 0}
+                }
+            else:
+                market_position = {"position": "unknown", "competitors": 0, "investors": 0}
+            
+            self._cache_set(cache_key, market_position)
+            return dict(market_position)
+            
+        except Exception as e:
+            logger.error(f"Failed to calculate market position: {e}")
+            return {"position": "error", "competitors": 0, "investors": 0}
     
     async def close(self):
         """Close Neo4j connection."""
@@ -453,12 +729,25 @@ class StartupKnowledgeGraph:
             await self.driver.close()
 
 
-# Global instance
+# Global instance, shared across requests so the Bolt pool stays warm
 _graph_instance: Optional[StartupKnowledgeGraph] = None
+_graph_init_lock = asyncio.Lock()
 
-def get_knowledge_graph() -> StartupKnowledgeGraph:
-    """Get or create knowledge graph instance."""
+async def get_knowledge_graph() -> StartupKnowledgeGraph:
+    """Get or create the connected knowledge graph instance."""
     global _graph_instance
     if _graph_instance is None:
-        _graph_instance = StartupKnowledgeGraph()
+        async with _graph_init_lock:
+            if _graph_instance is None:
+                graph = StartupKnowledgeGraph()
+                await graph.connect()
+                _graph_instance = graph
     return _graph_instance
+
+
+async def close_knowledge_graph():
+    """Close the shared knowledge graph driver, if one was created."""
+    global _graph_instance
+    if _graph_instance is not None:
+        await _graph_instance.close()
+        _graph_instance = None
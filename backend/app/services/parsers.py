@@ -1,20 +1,376 @@
 """Document parsing service for various file types."""
 
+import asyncio
 import base64
+import hashlib
 import io
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any, Optional
+import tempfile
+import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import json
 
+import numpy as np
+
 from ..models.dto import DocumentChunk, DocumentType
 from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..core.errors import ProcessingError
-from ..core.security import generate_chunk_id
+from ..core.security import chunk_id_prefix, generate_chunk_id
 
 logger = get_logger(__name__)
 
+# Whitespace-delimited word token, used to find chunk boundaries
+_WORD_RE = re.compile(r'\S+')
+
+# Transcript timestamp marker, e.g. "[00:01:23]"
+_TIMESTAMP_RE = re.compile(r'\[(\d{2}:\d{2}:\d{2})\]')
+
+# PDFs with fewer pages than this are extracted in-process; the worker
+# round-trip (pickling the PDF bytes) is not worth it for short decks
+PDF_PARALLEL_MIN_PAGES = 8
+PDF_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Image-only pages OCR'd per Tesseract invocation (one model load per batch)
+OCR_BATCH_SIZE = 8
+
+# Common page size EasyOCR resizes a batch to (readtext_batched needs one shape)
+EASYOCR_BATCH_CANVAS = 1000
+
+# Render scale for OCR'd PDF pages (2x = 144 DPI), rendered single-channel
+OCR_RENDER_SCALE = 2
+
+# Parsed-chunk cache for re-uploads of identical files, bounded by the total
+# number of cached chunks rather than by entry count
+PARSE_CACHE_MAX_CHUNKS = 20000
+
+# Synchronous Speech-to-Text only accepts up to a minute of audio; longer
+# files go through long_running_recognize. Compressed audio whose duration
+# can't be read from the header is treated as long above ~1 minute of 128kbps.
+SYNC_RECOGNIZE_MAX_SECONDS = 60
+SYNC_RECOGNIZE_MAX_BYTES = 1024 * 1024
+# Upper bound on waiting for a long-running recognition (inline audio is
+# capped at 10MB, i.e. minutes of speech)
+LONG_RECOGNIZE_TIMEOUT_SECONDS = 900
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_parse_cache: "OrderedDict[Tuple[str, str, str], List[DocumentChunk]]" = OrderedDict()
+_parse_cache_chunks = 0
+
+_parse_semaphore: Optional[asyncio.Semaphore] = None
+
+# MuPDF and pdfium are not thread-safe, even across documents; every
+# in-process open and extraction holds this (workers are single-threaded)
+_native_pdf_lock = threading.Lock()
+
+_easyocr_reader = None
+_easyocr_lock = threading.Lock()
+_ocr_warmup: Optional[asyncio.Task] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for CPU-bound PDF page extraction."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn avoids forking the server's threads into workers
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=PDF_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+
+def _get_easyocr_reader():
+    """Get the shared EasyOCR reader, loading its model weights on first use.
+    
+    Raises:
+        ImportError: If EasyOCR is not installed
+    """
+    global _easyocr_reader
+    if _easyocr_reader is None:
+        with _easyocr_lock:
+            if _easyocr_reader is None:
+                import easyocr
+                
+                logger.info("Loading EasyOCR model")
+                _easyocr_reader = easyocr.Reader(
+                    ['en'],
+                    model_storage_directory=get_settings().EASYOCR_MODEL_DIR
+                )
+    return _easyocr_reader
+
+
+def warm_ocr_reader() -> None:
+    """Load the EasyOCR model ahead of the first image upload."""
+    try:
+        _get_easyocr_reader()
+    except ImportError:
+        logger.warning("EasyOCR not installed, image OCR will use Tesseract")
+    except Exception as e:
+        logger.warning(f"EasyOCR warm-up failed: {str(e)}")
+
+
+def start_ocr_warmup() -> asyncio.Task:
+    """Load the EasyOCR model in a background thread without delaying startup.
+    
+    Must be called from the running event loop. The task is kept here so
+    OCR callers can wait for it (see _await_ocr_warmup).
+    """
+    global _ocr_warmup
+    if _ocr_warmup is None:
+        _ocr_warmup = asyncio.create_task(asyncio.to_thread(warm_ocr_reader))
+    return _ocr_warmup
+
+
+async def _await_ocr_warmup() -> None:
+    """Wait for a background EasyOCR load still in progress.
+    
+    Shielded so a cancelled request doesn't cancel the shared warm-up.
+    """
+    if _ocr_warmup is not None and not _ocr_warmup.done():
+        await asyncio.shield(_ocr_warmup)
+
+
+def _ocr_png(image_data: bytes) -> str:
+    """Perform Tesseract OCR on PNG image bytes."""
+    try:
+        from PIL import Image
+        import pytesseract
+        
+        image = Image.open(io.BytesIO(image_data))
+        return pytesseract.image_to_string(image)
+    except ImportError:
+        logger.warning("Tesseract not installed for OCR")
+        return ""
+    except Exception as e:
+        logger.warning(f"OCR failed: {str(e)}")
+        return ""
+
+
+def _ocr_gray(width: int, height: int, samples: bytes) -> str:
+    """Perform Tesseract OCR on raw 8-bit grayscale pixels."""
+    try:
+        from PIL import Image
+        import pytesseract
+        
+        image = Image.frombytes("L", (width, height), samples)
+        return pytesseract.image_to_string(image)
+    except ImportError:
+        logger.warning("Tesseract not installed for OCR")
+        return ""
+    except Exception as e:
+        logger.warning(f"OCR failed: {str(e)}")
+        return ""
+
+
+def _easyocr_gray_batch(images: List[Tuple[int, int, bytes]]) -> Optional[List[str]]:
+    """OCR raw grayscale images in one EasyOCR batched call.
+    
+    Pages are resized to a common canvas so the recognizer runs one batch
+    (one kernel dispatch on GPU, larger GEMMs on CPU) instead of one call
+    per page.
+    
+    Returns:
+        Text per image, or None if EasyOCR is unavailable or fails
+    """
+    try:
+        reader = _get_easyocr_reader()
+        arrays = [
+            np.frombuffer(samples, dtype=np.uint8).reshape(height, width)
+            for width, height, samples in images
+        ]
+        results = reader.readtext_batched(
+            arrays,
+            n_width=EASYOCR_BATCH_CANVAS,
+            n_height=EASYOCR_BATCH_CANVAS,
+            batch_size=OCR_BATCH_SIZE
+        )
+        return [' '.join(result[1] for result in page_results) for page_results in results]
+    except ImportError:
+        return None
+    except Exception as e:
+        logger.warning(f"EasyOCR batch failed, falling back to Tesseract: {str(e)}")
+        return None
+
+
+def _ocr_gray_batch(images: List[Tuple[int, int, bytes]]) -> List[str]:
+    """OCR several raw grayscale images with a single Tesseract invocation.
+    
+    Tesseract accepts a text file listing image paths and separates the
+    output of each image with a form feed. Pages are written as binary PGM
+    (header + raw samples), so no image codec runs on either side. Falls
+    back to per-image OCR if the batched output cannot be split back into
+    pages.
+    """
+    if len(images) == 1:
+        return [_ocr_gray(*images[0])]
+    
+    try:
+        import pytesseract
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, (width, height, samples) in enumerate(images):
+                path = os.path.join(tmp_dir, f"page-{i:04d}.pgm")
+                with open(path, "wb") as f:
+                    f.write(f"P5\n{width} {height}\n255\n".encode("ascii"))
+                    f.write(samples)
+                paths.append(path)
+            
+            list_path = os.path.join(tmp_dir, "pages.txt")
+            with open(list_path, "w") as f:
+                f.write("\n".join(paths) + "\n")
+            
+            output = pytesseract.image_to_string(list_path)
+        
+        texts = output.split("\f")
+        if len(texts) >= len(images):
+            return texts[:len(images)]
+        logger.warning("Batched OCR output did not match page count, retrying per page")
+    except ImportError:
+        logger.warning("Tesseract not installed for OCR")
+        return [""] * len(images)
+    except Exception as e:
+        logger.warning(f"Batched OCR failed: {str(e)}")
+    
+    return [_ocr_gray(*image) for image in images]
+
+
+def _audio_duration_seconds(content: bytes) -> Optional[float]:
+    """Read the duration of WAV audio from its header, if possible."""
+    try:
+        with wave.open(io.BytesIO(content)) as audio:
+            return audio.getnframes() / float(audio.getframerate())
+    except Exception:
+        return None
+
+
+def _is_long_audio(content: bytes) -> bool:
+    """Whether audio is too long for synchronous recognition."""
+    duration = _audio_duration_seconds(content)
+    if duration is None:
+        return len(content) > SYNC_RECOGNIZE_MAX_BYTES
+    return duration > SYNC_RECOGNIZE_MAX_SECONDS
+
+
+def _extract_pdf_pages(content: bytes, start: int, stop: int) -> Tuple[List[Tuple[int, List[str]]], List[Tuple[int, Tuple[int, int, bytes]]]]:
+    """Open a PDF and extract pages [start, stop).
+    
+    Module-level so it can run in a worker process. Image-only pages come
+    back rasterized; OCR stays in the parent so only one process loads the
+    OCR model.
+    """
+    import fitz  # PyMuPDF
+    
+    with fitz.open(stream=content, filetype="pdf") as pdf:
+        return _extract_document_pages(pdf, content, start, stop)
+
+
+def _pdfium_page_words(content: bytes, start: int, stop: int) -> Optional[List[List[str]]]:
+    """Extract words for pages [start, stop) with pdfium's plain text API.
+    
+    pdfium skips MuPDF's layout reconstruction, which is wasted work when
+    only the text is needed.
+    
+    In-process callers must hold _native_pdf_lock; pool workers are
+    single-threaded.
+    
+    Returns:
+        Words per page, or None if pypdfium2 is unavailable or fails
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+    
+    try:
+        pdf = pdfium.PdfDocument(content)
+        try:
+            page_words = []
+            for index in range(start, stop):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                page_words.append(textpage.get_text_range().split())
+                textpage.close()
+                page.close()
+            return page_words
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.warning(f"pdfium text extraction failed, using PyMuPDF: {str(e)}")
+        return None
+
+
+def _extract_document_pages(
+    pdf: Any,
+    content: bytes,
+    start: int,
+    stop: int
+) -> Tuple[List[Tuple[int, List[str]]], List[Tuple[int, Tuple[int, int, bytes]]]]:
+    """Extract words for pages [start, stop), rasterizing image-only pages.
+    
+    Text comes from pdfium when installed, otherwise straight from PyMuPDF's
+    word list. MuPDF is only used to render pages that have no text layer;
+    those are left for _ocr_pages.
+    
+    Returns:
+        List of (1-based page number, words) tuples, and a list of
+        (page number, (width, height, gray samples)) for pages awaiting OCR
+    """
+    import fitz  # PyMuPDF
+    
+    pdfium_words = _pdfium_page_words(content, start, stop)
+    results = []
+    pending = []
+    ocr_matrix = fitz.Matrix(OCR_RENDER_SCALE, OCR_RENDER_SCALE)
+    
+    for index in range(start, stop):
+        # Try text extraction first
+        if pdfium_words is not None:
+            words = pdfium_words[index - start]
+        else:
+            # (x0, y0, x1, y1, word, block, line, wno)
+            words = [word[4] for word in pdf[index].get_text("words")]
+        results.append((index + 1, words))
+        
+        # If no text found, render the page for OCR
+        if not words:
+            page = pdf[index]
+            pix = page.get_pixmap(matrix=ocr_matrix, colorspace=fitz.csGRAY, alpha=False)
+            pending.append((index + 1, (pix.width, pix.height, pix.samples)))
+    
+    return results, pending
+
+
+def _ocr_pages(
+    pages: List[Tuple[int, List[str]]],
+    rasters: List[Tuple[int, Tuple[int, int, bytes]]]
+) -> List[Tuple[int, List[str]]]:
+    """OCR rasterized image-only pages in batches and fill in their words.
+    
+    Runs in the serving process, so the EasyOCR model is loaded once there
+    rather than once per PDF worker.
+    """
+    ocr_words = {}
+    for i in range(0, len(rasters), OCR_BATCH_SIZE):
+        batch = rasters[i:i + OCR_BATCH_SIZE]
+        images = [image for _, image in batch]
+        # EasyOCR first, as for uploaded images; Tesseract if it is unavailable
+        texts = _easyocr_gray_batch(images)
+        if texts is None:
+            texts = _ocr_gray_batch(images)
+        for (page_num, _), text in zip(batch, texts):
+            ocr_words[page_num] = text.split()
+    return [(page_num, ocr_words.get(page_num, words)) for page_num, words in pages]
+
 
 class DocumentParser:
     """Base document parser."""
@@ -73,45 +429,176 @@ class DocumentParser:
         Returns:
             List of chunks
         """
-        chunks = []
-        words = text.split()
+        # Word (start, end) offsets packed as an (n, 2) int32 array instead of
+        # a list of str/tuple objects; chunks are sliced straight from `text`
+        spans = np.fromiter(
+            chain.from_iterable(m.span() for m in _WORD_RE.finditer(text)),
+            dtype=np.int32
+        ).reshape(-1, 2)
         
-        if not words:
-            return chunks
+        return list(self._window_chunks(
+            len(spans),
+            lambda start, end: text[int(spans[start, 0]):int(spans[end - 1, 1])],
+            startup_id, document_id, doc_type, source, metadata
+        ))
+    
+    def _iter_chunks_from_words(
+        self,
+        words: List[str],
+        startup_id: str,
+        document_id: str,
+        doc_type: DocumentType,
+        source: str,
+        metadata: Dict[str, Any] = None
+    ) -> Iterator[DocumentChunk]:
+        """Lazily create chunks from pre-tokenized words (e.g. PDF word lists).
+        
+        Args:
+            words: Word tokens in reading order
+            startup_id: Startup identifier
+            document_id: Document identifier
+            doc_type: Document type
+            source: Source filename
+            metadata: Additional metadata
+            
+        Yields:
+            Chunks in order
+        """
+        return self._window_chunks(
+            len(words),
+            lambda start, end: ' '.join(words[start:end]),
+            startup_id, document_id, doc_type, source, metadata
+        )
+    
+    def _window_chunks(
+        self,
+        num_words: int,
+        chunk_text_for: Callable[[int, int], str],
+        startup_id: str,
+        document_id: str,
+        doc_type: DocumentType,
+        source: str,
+        metadata: Optional[Dict[str, Any]]
+    ) -> Iterator[DocumentChunk]:
+        """Slide the overlapping chunk window over `num_words` words.
+        
+        `chunk_text_for(start, end)` returns the text of words [start, end).
+        Chunks are generated one at a time, so callers can consume them
+        without an intermediate list per page.
+        """
+        if not num_words:
+            return
         
+        # Guard against chunk_size <= chunk_overlap, which would never advance
+        stride = max(1, self.chunk_size - self.chunk_overlap)
+        id_prefix = chunk_id_prefix(document_id)
+        base_meta = dict(metadata) if metadata else {}
         chunk_index = 0
         i = 0
         
-        while i < len(words):
-            # Get chunk words
-            chunk_words = words[i:i + self.chunk_size]
-            chunk_text = ' '.join(chunk_words)
+        while i < num_words:
+            # Get chunk window
+            end = min(i + self.chunk_size, num_words)
+            chunk_text = chunk_text_for(i, end)
+            
+            chunk_meta = base_meta.copy()
+            chunk_meta['chunk_index'] = chunk_index
+            chunk_meta['word_count'] = end - i
             
             # Create chunk
-            chunk = DocumentChunk(
-                id=generate_chunk_id(document_id, chunk_index),
+            yield DocumentChunk(
+                id=f"{id_prefix}{chunk_index:04d}",
                 startup_id=startup_id,
                 type=doc_type,
                 source=source,
                 text=chunk_text,
-                metadata={
-                    **(metadata or {}),
-                    'chunk_index': chunk_index,
-                    'word_count': len(chunk_words)
-                }
+                metadata=chunk_meta
             )
-            chunks.append(chunk)
+            
+            # This window reached the end; another would only repeat its tail
+            if end >= num_words:
+                break
             
             # Move forward with overlap
-            i += self.chunk_size - self.chunk_overlap
+            i += stride
             chunk_index += 1
-        
-        return chunks
 
 
 class PDFParser(DocumentParser):
     """PDF document parser."""
     
+    # Opened documents kept per parser instance (see _open_pdf), bounded by
+    # the size of the PDF bytes each one keeps alive
+    PDF_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self):
+        """Initialize parser with a small cache of opened PDFs."""
+        super().__init__()
+        # Key -> (document, content size)
+        self._pdf_cache: "OrderedDict[bytes, Tuple[Any, int]]" = OrderedDict()
+        self._pdf_cache_bytes = 0
+        # Guards the cache itself; document use holds _native_pdf_lock
+        self._pdf_lock = threading.Lock()
+    
+    @contextmanager
+    def _open_pdf(self, content: bytes) -> Iterator[Any]:
+        """Open a PDF for exclusive use, reusing the document for content seen recently.
+        
+        The caller holds _native_pdf_lock for the whole block, since MuPDF
+        and pdfium may not run on two threads at once; `_pdf_lock` covers
+        only the cache lookup and insert. Evicted documents are closed by
+        garbage collection once no caller holds them.
+        """
+        import fitz  # PyMuPDF
+        
+        key = hashlib.blake2b(content, digest_size=8).digest()
+        with _native_pdf_lock:
+            with self._pdf_lock:
+                entry = self._pdf_cache.get(key)
+                if entry is not None:
+                    self._pdf_cache.move_to_end(key)
+            
+            if entry is None:
+                pdf = fitz.open(stream=content, filetype="pdf")
+                if len(content) > self.PDF_CACHE_MAX_BYTES:
+                    # Too large to keep alive; this caller holds the only reference
+                    try:
+                        yield pdf
+                    finally:
+                        pdf.close()
+                    return
+                entry = self._cache_pdf(key, (pdf, len(content)))
+            
+            yield entry[0]
+    
+    def _cache_pdf(self, key: bytes, entry: Tuple[Any, int]) -> Tuple[Any, int]:
+        """Add an opened document, evicting the oldest ones over the byte cap.
+        
+        Returns:
+            The cached entry, which is another caller's if it opened the same
+            PDF first
+        """
+        with self._pdf_lock:
+            existing = self._pdf_cache.get(key)
+            if existing is not None:
+                return existing
+            self._pdf_cache[key] = entry
+            self._pdf_cache_bytes += entry[1]
+            while self._pdf_cache_bytes > self.PDF_CACHE_MAX_BYTES:
+                _, (_, size) = self._pdf_cache.popitem(last=False)
+                self._pdf_cache_bytes -= size
+        return entry
+    
+    def _count_pages(self, content: bytes) -> int:
+        """Return the number of pages in a PDF."""
+        with self._open_pdf(content) as pdf:
+            return pdf.page_count
+    
+    def _extract_pages(self, content: bytes, start: int, stop: int) -> Tuple[List[Tuple[int, List[str]]], List[Tuple[int, Tuple[int, int, bytes]]]]:
+        """Extract pages [start, stop) in-process from the cached document."""
+        with self._open_pdf(content) as pdf:
+            return _extract_document_pages(pdf, content, start, stop)
+    
     async def parse(
         self,
         content: bytes,
@@ -140,7 +627,7 @@ class PDFParser(DocumentParser):
                 )
             else:
                 # Use PyMuPDF
-                chunks = self._parse_with_pymupdf(
+                chunks = await self._parse_with_pymupdf(
                     content, filename, startup_id, document_id
                 )
         except Exception as e:
@@ -149,7 +636,7 @@ class PDFParser(DocumentParser):
         
         return chunks
     
-    def _parse_with_pymupdf(
+    async def _parse_with_pymupdf(
         self,
         content: bytes,
         filename: str,
@@ -158,6 +645,10 @@ class PDFParser(DocumentParser):
     ) -> List[DocumentChunk]:
         """Parse PDF with PyMuPDF.
         
+        Long PDFs are split into page ranges extracted in parallel worker
+        processes, since MuPDF layout and rendering are CPU-bound. Image-only
+        pages are OCR'd afterwards in this process with the shared reader.
+        
         Args:
             content: PDF content
             filename: Original filename
@@ -172,45 +663,54 @@ class PDFParser(DocumentParser):
         try:
             import fitz  # PyMuPDF
             
-            # Open PDF
-            pdf = fitz.open(stream=content, filetype="pdf")
+            # Size the work off the event loop; opening parses the xref table
+            page_count = await asyncio.to_thread(self._count_pages, content)
             
-            # Extract text from each page
-            for page_num, page in enumerate(pdf, 1):
-                # Try text extraction first
-                text = page.get_text()
-                
-                # If no text found, try OCR on the page
-                if not text.strip():
-                    # Convert page to image for OCR
-                    pix = page.get_pixmap()
-                    img_data = pix.tobytes("png")
-                    
-                    # Try OCR on the image
-                    text = self._ocr_image(img_data)
-                
-                if text.strip():
+            if page_count < PDF_PARALLEL_MIN_PAGES:
+                pages, rasters = await asyncio.to_thread(self._extract_pages, content, 0, page_count)
+            else:
+                loop = asyncio.get_running_loop()
+                pool = _get_pdf_pool()
+                step = -(-page_count // PDF_MAX_WORKERS)
+                batches = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        pool, _extract_pdf_pages, content, start, min(start + step, page_count)
+                    )
+                    for start in range(0, page_count, step)
+                ])
+                pages = [page for batch_pages, _ in batches for page in batch_pages]
+                rasters = [raster for _, batch_rasters in batches for raster in batch_rasters]
+            
+            # Workers only render image-only pages; OCR them here
+            if rasters:
+                pages = await asyncio.to_thread(_ocr_pages, pages, rasters)
+            
+            for page_num, words in pages:
+                # Yield between pages so large decks don't starve other requests
+                await asyncio.sleep(0)
+                if words:
                     # Create chunks for this page
-                    page_chunks = self._create_chunks(
-                        text=text,
+                    chunks.extend(self._iter_chunks_from_words(
+                        words=words,
                         startup_id=startup_id,
                         document_id=document_id,
                         doc_type=DocumentType.SLIDE,
                         source=filename,
                         metadata={'page': page_num}
-                    )
-                    chunks.extend(page_chunks)
-            
-            pdf.close()
+                    ))
             
         except ImportError:
             logger.warning("PyMuPDF not installed. Install with: pip install PyMuPDF")
             # Fallback to pdfplumber
-            chunks = self._parse_with_pdfplumber(content, filename, startup_id, document_id)
+            chunks = await asyncio.to_thread(
+                self._parse_with_pdfplumber, content, filename, startup_id, document_id
+            )
         except Exception as e:
             logger.error(f"PDF parsing error: {str(e)}")
             # Try alternative parser
-            chunks = self._parse_with_pdfplumber(content, filename, startup_id, document_id)
+            chunks = await asyncio.to_thread(
+                self._parse_with_pdfplumber, content, filename, startup_id, document_id
+            )
         
         return chunks
     
@@ -285,20 +785,7 @@ class PDFParser(DocumentParser):
         Returns:
             Extracted text
         """
-        try:
-            from PIL import Image
-            import pytesseract
-            import io
-            
-            image = Image.open(io.BytesIO(image_data))
-            text = pytesseract.image_to_string(image)
-            return text
-        except ImportError:
-            logger.warning("Tesseract not installed for OCR")
-            return ""
-        except Exception as e:
-            logger.warning(f"OCR failed: {str(e)}")
-            return ""
+        return _ocr_png(image_data)
     
     async def _parse_with_document_ai(
         self,
@@ -372,7 +859,7 @@ class PDFParser(DocumentParser):
         except Exception as e:
             logger.error(f"Document AI error: {str(e)}")
             # Fallback to PyMuPDF
-            chunks = self._parse_with_pymupdf(
+            chunks = await self._parse_with_pymupdf(
                 content, filename, startup_id, document_id
             )
         
@@ -426,6 +913,20 @@ class TextParser(DocumentParser):
             if 'transcript' in filename.lower():
                 doc_type = DocumentType.TRANSCRIPT
             
+            # Tiny documents fit in one chunk; split stops after chunk_size words
+            head = text.split(None, self.chunk_size)
+            if len(head) <= self.chunk_size:
+                if not head:
+                    return []
+                return [DocumentChunk(
+                    id=generate_chunk_id(document_id, 0),
+                    startup_id=startup_id,
+                    type=doc_type,
+                    source=filename,
+                    text=text.strip(),
+                    metadata={'format': 'text', 'chunk_index': 0, 'word_count': len(head)}
+                )]
+            
             # Create chunks
             chunks = self._create_chunks(
                 text=text,
@@ -493,13 +994,15 @@ class TranscriptParser(DocumentParser):
         try:
             text = content.decode('utf-8', errors='replace')
             
-            # Parse timestamps if present
-            timestamp_pattern = r'\[(\d{2}:\d{2}:\d{2})\](.*?)(?=\[\d{2}:\d{2}:\d{2}\]|$)'
-            matches = re.findall(timestamp_pattern, text, re.DOTALL)
+            # Parse timestamps if present; each segment runs to the next marker
+            markers = list(_TIMESTAMP_RE.finditer(text))
             
-            if matches:
+            if markers:
                 # Process timestamped segments
-                for timestamp, segment_text in matches:
+                ends = [m.start() for m in markers[1:]] + [len(text)]
+                for marker, end in zip(markers, ends):
+                    timestamp = marker.group(1)
+                    segment_text = text[marker.end():end]
                     if segment_text.strip():
                         chunk = DocumentChunk(
                             id=generate_chunk_id(document_id, len(chunks)),
@@ -572,8 +1075,20 @@ class TranscriptParser(DocumentParser):
             # Create request
             audio = speech_v1.RecognitionAudio(content=content)
             
-            # Perform transcription
-            response = client.recognize(config=config, audio=audio)
+            # Perform transcription off the event loop; long audio uses the
+            # long-running API, which also accepts more than a minute
+            if _is_long_audio(content):
+                # The submit RPC uploads the inline audio, so it runs in the thread too
+                operation = await asyncio.to_thread(
+                    client.long_running_recognize, config=config, audio=audio
+                )
+                response = await asyncio.to_thread(
+                    operation.result, timeout=LONG_RECOGNIZE_TIMEOUT_SECONDS
+                )
+            else:
+                response = await asyncio.to_thread(
+                    client.recognize, config=config, audio=audio
+                )
             
             # Process results
             for result in response.results:
@@ -636,7 +1151,9 @@ class ImageParser(DocumentParser):
                     content, filename, startup_id, document_id
                 )
             else:
-                # Use EasyOCR
+                # Use EasyOCR; a load still running in the background would
+                # otherwise block the event loop on the reader lock
+                await _await_ocr_warmup()
                 chunks = self._parse_with_easyocr(
                     content, filename, startup_id, document_id
                 )
@@ -669,11 +1186,10 @@ class ImageParser(DocumentParser):
         
         # Try EasyOCR first
         try:
-            import easyocr
             from PIL import Image
             
-            # Initialize reader
-            reader = easyocr.Reader(['en'])
+            # Shared reader (model weights load once per process)
+            reader = _get_easyocr_reader()
             
             # Convert bytes to image
             image = Image.open(io.BytesIO(content))
@@ -764,8 +1280,23 @@ class ImageParser(DocumentParser):
 class ParserFactory:
     """Factory for creating appropriate parsers."""
     
-    @staticmethod
-    def get_parser(filename: str) -> DocumentParser:
+    # Checked before the filename "transcript" hint
+    _PRIMARY_PARSERS = {
+        '.pdf': PDFParser,
+        '.txt': TextParser,
+        '.md': TextParser,
+        '.mp3': TranscriptParser,
+        '.wav': TranscriptParser,
+        '.mp4': TranscriptParser,
+        '.webm': TranscriptParser,
+    }
+    _IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp'})
+    
+    # Parsers are stateless given settings, so one instance per class is shared
+    _instances: Dict[type, DocumentParser] = {}
+    
+    @classmethod
+    def get_parser(cls, filename: str) -> DocumentParser:
         """Get appropriate parser for file type.
         
         Args:
@@ -779,16 +1310,19 @@ class ParserFactory:
         """
         ext = Path(filename).suffix.lower()
         
-        if ext == '.pdf':
-            return PDFParser()
-        elif ext in ['.txt', '.md']:
-            return TextParser()
-        elif ext in ['.mp3', '.wav', '.mp4', '.webm'] or 'transcript' in filename.lower():
-            return TranscriptParser()
-        elif ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-            return ImageParser()
-        else:
-            raise ProcessingError(f"Unsupported file type: {ext}", ext)
+        parser_cls = cls._PRIMARY_PARSERS.get(ext)
+        if parser_cls is None:
+            if 'transcript' in filename.lower():
+                parser_cls = TranscriptParser
+            elif ext in cls._IMAGE_EXTENSIONS:
+                parser_cls = ImageParser
+            else:
+                raise ProcessingError(f"Unsupported file type: {ext}", ext)
+        
+        parser = cls._instances.get(parser_cls)
+        if parser is None:
+            parser = cls._instances[parser_cls] = parser_cls()
+        return parser
 
 
 async def parse_document(
@@ -808,5 +1342,72 @@ async def parse_document(
     Returns:
         List of document chunks
     """
+    key = (
+        hashlib.blake2b(content, digest_size=16).hexdigest(),
+        filename,
+        startup_id
+    )
+    cached = _parse_cache_get(key)
+    if cached is not None:
+        logger.info(f"Reusing cached chunks for {filename} ({len(cached)} chunks)")
+        return _rebind_chunks(cached, document_id)
+    
     parser = ParserFactory.get_parser(filename)
-    return await parser.parse(content, filename, startup_id, document_id)
+    # Each parse can hold hundreds of MB (MuPDF, OCR models); bound how many run
+    async with _get_parse_semaphore():
+        chunks = await parser.parse(content, filename, startup_id, document_id)
+    # Fresh chunks already carry this document's IDs; only cache hits are rebound
+    _parse_cache_set(key, chunks)
+    return chunks
+
+
+def _get_parse_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent document parses."""
+    global _parse_semaphore
+    if _parse_semaphore is None:
+        _parse_semaphore = asyncio.Semaphore(max(1, get_settings().MAX_PARSE_CONCURRENCY))
+    return _parse_semaphore
+
+
+def _parse_cache_get(key: Tuple[str, str, str]) -> Optional[List[DocumentChunk]]:
+    """Look up parsed chunks, marking the entry most recently used."""
+    chunks = _parse_cache.get(key)
+    if chunks is not None:
+        _parse_cache.move_to_end(key)
+    return chunks
+
+
+def _parse_cache_set(key: Tuple[str, str, str], chunks: List[DocumentChunk]) -> None:
+    """Cache parsed chunks, evicting least recently used entries over the chunk cap.
+    
+    Failure placeholders (chunks with an 'error' in their metadata) are not
+    cached, so a transient parse error is retried on the next upload.
+    """
+    global _parse_cache_chunks
+    
+    if not chunks or len(chunks) > PARSE_CACHE_MAX_CHUNKS:
+        return
+    if any('error' in chunk.metadata for chunk in chunks):
+        return
+    
+    previous = _parse_cache.pop(key, None)
+    if previous is not None:
+        _parse_cache_chunks -= len(previous)
+    
+    _parse_cache[key] = chunks
+    _parse_cache_chunks += len(chunks)
+    
+    while _parse_cache_chunks > PARSE_CACHE_MAX_CHUNKS:
+        _, evicted = _parse_cache.popitem(last=False)
+        _parse_cache_chunks -= len(evicted)
+
+
+def _rebind_chunks(chunks: List[DocumentChunk], document_id: str) -> List[DocumentChunk]:
+    """Copy cached chunks for a new upload, regenerating the document-scoped IDs."""
+    return [
+        chunk.model_copy(
+            update={'id': generate_chunk_id(document_id, chunk.metadata.get('chunk_index', i))},
+            deep=True
+        )
+        for i, chunk in enumerate(chunks)
+    ]
@@ -3,16 +3,35 @@
 No chunking/embeddings needed - Gemini 1.5/2.0 handles 1M-2M tokens!
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Callable, Dict, Any
 from pathlib import Path
+import hashlib
 import io
+import os
+import tempfile
 
 from ..core.logging import get_logger
 from ..core.errors import ProcessingError
 from ..core.config import get_settings
+from .parsers import PDF_MAX_WORKERS, _get_pdf_pool
 
 logger = get_logger(__name__)
 
+# Below this many pages per worker, process start-up and pickling the PDF
+# cost more than extracting serially
+PDF_PARALLEL_PAGES_PER_WORKER = 16
+
+# Content streams above this size are extracted from a single-page copy
+HEAVY_CONTENT_STREAM_BYTES = 1024 * 1024
+
+# First-page text needed to treat a PDF as text-native (skipping OCR)
+TEXT_LAYER_MIN_CHARS = 200
+TEXT_LAYER_MIN_WORDS = 30
+
+# Parsed text files kept in the on-disk cache (oldest by mtime evicted)
+PARSE_CACHE_MAX_FILES = 1024
+
 
 def parse_pdf(content: bytes, filename: str) -> str:
     """Extract full text from PDF.
@@ -28,8 +47,8 @@ def parse_pdf(content: bytes, filename: str) -> str:
     text = ""
     
     try:
-        if settings.USE_VERTEX:
-            # Use Document AI for best accuracy
+        if settings.USE_VERTEX and not _has_text_layer(content):
+            # Scanned PDF: use Document AI OCR for best accuracy
             text = _parse_pdf_with_document_ai(content)
         else:
             # Use PyMuPDF locally
@@ -38,7 +57,7 @@ def parse_pdf(content: bytes, filename: str) -> str:
         logger.error(f"PDF parsing failed: {e}")
         # Try fallback
         try:
-            text = _parse_pdf_with_pdfplumber(content)
+            text = _parse_pdf_with_pypdfium2(content)
         except Exception as e2:
             logger.error(f"PDF fallback failed: {e2}")
             text = f"[PDF parsing failed for {filename}]"
@@ -46,49 +65,199 @@ def parse_pdf(content: bytes, filename: str) -> str:
     return text
 
 
+def _has_text_layer(content: bytes) -> bool:
+    """Probe the first page for a usable text layer.
+    
+    Text-native PDFs extract completely with PyMuPDF in milliseconds, so
+    only PDFs whose first page has (almost) no text need Document AI OCR.
+    """
+    try:
+        import fitz  # PyMuPDF
+        
+        pdf = fitz.open(stream=content, filetype="pdf")
+        try:
+            if not pdf.page_count:
+                return False
+            text = pdf.load_page(0).get_text("text", **_pdf_text_options())
+        finally:
+            pdf.close()
+    except Exception:
+        return False
+    
+    return len(text) > TEXT_LAYER_MIN_CHARS and len(text.split()) > TEXT_LAYER_MIN_WORDS
+
+
 def _parse_pdf_with_pymupdf(content: bytes) -> str:
-    """Extract text using PyMuPDF."""
+    """Extract text using PyMuPDF.
+    
+    PDFs of PDF_PARALLEL_PAGES_PER_WORKER pages or more are split into page
+    ranges extracted in the shared worker pool; each worker opens its own
+    document, since MuPDF contexts can't be shared across processes.
+    """
     import fitz  # PyMuPDF
     
-    text_parts = []
     pdf = fitz.open(stream=content, filetype="pdf")
+    try:
+        page_count = pdf.page_count
+        if page_count < PDF_PARALLEL_PAGES_PER_WORKER:
+            return _pdf_pages_text(pdf, 0, page_count)
+    finally:
+        pdf.close()
+    
+    workers = min(PDF_MAX_WORKERS, -(-page_count // PDF_PARALLEL_PAGES_PER_WORKER))
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    ranges = _get_pdf_pool().map(
+        _extract_pdf_text_range,
+        [content] * len(starts),
+        starts,
+        [min(start + step, page_count) for start in starts]
+    )
+    # map() preserves submission order, so ranges come back in page order
+    return "\n".join(text for text in ranges if text)
+
+
+def _extract_pdf_text_range(content: bytes, start: int, stop: int) -> str:
+    """Open a PDF and extract pages [start, stop). Runs in a worker process."""
+    import fitz  # PyMuPDF
     
-    for page_num, page in enumerate(pdf, 1):
-        page_text = page.get_text()
+    pdf = fitz.open(stream=content, filetype="pdf")
+    try:
+        return _pdf_pages_text(pdf, start, stop)
+    finally:
+        pdf.close()
+
+
+def _pdf_pages_text(pdf: Any, start: int, stop: int) -> str:
+    """Extract pages [start, stop) of an open PDF with page markers."""
+    # Write pages straight into one buffer rather than holding a list of
+    # page strings alongside the joined result
+    buf = io.StringIO()
+    for page_num in range(start + 1, stop + 1):
+        page_text = _pdf_page_text(pdf, page_num - 1)
         
-        if page_text.strip():
-            text_parts.append(f"\n--- Page {page_num} ---\n{page_text}")
+        if page_text and not page_text.isspace():
+            _write_page(buf, page_num, page_text)
+    
+    return buf.getvalue()
+
+
+def _write_page(buf: io.StringIO, page_num: int, page_text: str) -> None:
+    """Append a page section ("--- Page N ---" header + text) to `buf`.
     
-    pdf.close()
-    return "\n".join(text_parts)
+    Sections are separated by a newline, matching "\n".join over sections.
+    Constant header parts are written as-is instead of formatting an
+    f-string per page.
+    """
+    if buf.tell():
+        buf.write("\n")
+    buf.write("\n--- Page ")
+    buf.write(str(page_num))
+    buf.write(" ---\n")
+    buf.write(page_text)
 
 
-def _parse_pdf_with_pdfplumber(content: bytes) -> str:
-    """Extract text using pdfplumber."""
-    import pdfplumber
+@lru_cache(maxsize=1)
+def _pdf_text_options() -> Dict[str, Any]:
+    """get_text() options for plain-text extraction.
     
-    text_parts = []
-    with pdfplumber.open(io.BytesIO(content)) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
-            page_text = page.extract_text() or ""
-            if page_text.strip():
-                text_parts.append(f"\n--- Page {page_num} ---\n{page_text}")
+    By default no block sorting and only clipping to the page: Gemini reads
+    content-stream order fine, so reading-order reconstruction, ligature
+    and whitespace preservation are skipped. PDF_PRESERVE_READING_ORDER
+    opts back into sorted output with PyMuPDF's standard text flags.
+    """
+    import fitz  # PyMuPDF
     
-    return "\n".join(text_parts)
+    if get_settings().PDF_PRESERVE_READING_ORDER:
+        return {"sort": True, "flags": fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES}
+    return {"sort": False, "flags": fitz.TEXT_MEDIABOX_CLIP}
 
 
-def _parse_pdf_with_document_ai(content: bytes) -> str:
-    """Extract text using Google Document AI."""
+def _pdf_page_text(pdf: Any, index: int) -> str:
+    """Extract one page's plain text, working around graphics-heavy pages.
+    
+    Pages whose content streams are mostly path/fill operators can take
+    seconds in place; extracting from a single-page copy without
+    annotations or links is typically orders of magnitude faster.
+    """
+    import fitz  # PyMuPDF
+    
+    text_options = _pdf_text_options()
+    page = pdf.load_page(index)
+    try:
+        stream_size = sum(len(pdf.xref_stream_raw(xref) or b"") for xref in page.get_contents())
+    except Exception:
+        stream_size = 0
+    
+    if stream_size <= HEAVY_CONTENT_STREAM_BYTES:
+        return page.get_text("text", **text_options)
+    
+    del page
+    single = fitz.open()
+    try:
+        single.insert_pdf(pdf, from_page=index, to_page=index, annots=False, links=False)
+        return single[0].get_text("text", **text_options)
+    finally:
+        single.close()
+
+
+def _parse_pdf_with_pypdfium2(content: bytes) -> str:
+    """Extract text using pypdfium2 (PDFium's range-based text API)."""
+    import pypdfium2 as pdfium
+    
+    buf = io.StringIO()
+    pdf = pdfium.PdfDocument(content)
+    try:
+        for page_num, page in enumerate(pdf, 1):
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            
+            if page_text and not page_text.isspace():
+                _write_page(buf, page_num, page_text)
+    finally:
+        pdf.close()
+    
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _docai_client_options() -> Any:
+    """Regional Document AI endpoint matching the processor location."""
+    from google.api_core.client_options import ClientOptions
+    
+    location = get_settings().GOOGLE_LOCATION
+    return ClientOptions(api_endpoint=f"{location}-documentai.googleapis.com")
+
+
+@lru_cache(maxsize=1)
+def _docai_client() -> Any:
+    """Shared Document AI client.
+    
+    Creating a client resolves credentials and opens a gRPC channel; one
+    client per process keeps the HTTP/2 connection warm across PDFs.
+    """
     from google.cloud import documentai_v1 as documentai
     
+    return documentai.DocumentProcessorServiceClient(client_options=_docai_client_options())
+
+
+@lru_cache(maxsize=1)
+def _processor_name() -> str:
+    """Resource name of the default OCR processor."""
     settings = get_settings()
-    client = documentai.DocumentProcessorServiceClient()
+    return f"projects/{settings.GOOGLE_PROJECT_ID}/locations/{settings.GOOGLE_LOCATION}/processors/ocr-processor"
+
+
+def _parse_pdf_with_document_ai(content: bytes) -> str:
+    """Extract text using Google Document AI."""
+    from google.cloud import documentai_v1 as documentai
     
-    # Use default OCR processor
-    name = f"projects/{settings.GOOGLE_PROJECT_ID}/locations/{settings.GOOGLE_LOCATION}/processors/ocr-processor"
+    client = _docai_client()
     
     request = documentai.ProcessRequest(
-        name=name,
+        name=_processor_name(),
         raw_document=documentai.RawDocument(
             content=content,
             mime_type="application/pdf"
@@ -110,7 +279,14 @@ def parse_text(content: bytes, filename: str) -> str:
         Full text
     """
     try:
-        return content.decode('utf-8', errors='replace')
+        # ASCII is the common case for docs; isascii() is a word-at-a-time
+        # scan and the ASCII codec skips UTF-8 validation entirely
+        if content.isascii():
+            return content.decode('ascii')
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            return content.decode('utf-8', errors='replace')
     except Exception as e:
         logger.error(f"Text parsing failed: {e}")
         return f"[Text parsing failed for {filename}]"
@@ -127,21 +303,103 @@ def parse_docx(content: bytes, filename: str) -> str:
         Full text
     """
     try:
-        from docx import Document
-        
-        doc = Document(io.BytesIO(content))
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        
-        return "\n\n".join(paragraphs)
+        return "\n\n".join(_iter_docx_paragraphs(content))
     except Exception as e:
         logger.error(f"DOCX parsing failed: {e}")
         return f"[DOCX parsing failed for {filename}]"
 
 
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W_NS}body"
+_W_RUN = f"{_W_NS}r"
+_W_HYPERLINK = f"{_W_NS}hyperlink"
+_W_TEXT = f"{_W_NS}t"
+_W_BREAK = f"{_W_NS}br"
+# Run children that carry text, as rendered by python-docx's Run.text
+_W_RUN_TEXT = {
+    _W_TEXT: None,
+    f"{_W_NS}tab": "\t",
+    f"{_W_NS}ptab": "\t",
+    _W_BREAK: "\n",
+    f"{_W_NS}cr": "\n",
+    f"{_W_NS}noBreakHyphen": "-",
+}
+
+
+def _docx_run_text(run) -> str:
+    """Text of one w:r, read from its direct children only.
+    
+    Drawings nested in the run (text boxes, mc:AlternateContent) are skipped,
+    and page/column breaks render as nothing.
+    """
+    parts = []
+    for node in run:
+        if node.tag not in _W_RUN_TEXT:
+            continue
+        if node.tag == _W_TEXT:
+            parts.append(node.text or "")
+        elif node.tag == _W_BREAK and node.get(f"{_W_NS}type", "textWrapping") != "textWrapping":
+            continue
+        else:
+            parts.append(_W_RUN_TEXT[node.tag])
+    return "".join(parts)
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of a w:p from its runs and hyperlinked runs, like python-docx's Paragraph.text."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_RUN:
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_docx_run_text(run) for run in child.iterchildren(_W_RUN))
+    return "".join(parts)
+
+
+def _iter_docx_paragraphs(content: bytes):
+    """Stream non-empty body paragraphs from a DOCX's document.xml.
+    
+    Matches python-docx 1.x's `Document.paragraphs` text (top-level body
+    paragraphs; text boxes and tables excluded) without building its object
+    tree: elements are cleared as soon as they end, so memory stays flat for
+    long documents.
+    """
+    import zipfile
+    from lxml import etree
+    
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        with archive.open("word/document.xml") as xml:
+            for _, elem in etree.iterparse(xml, events=("end",), tag=(f"{_W_NS}p", f"{_W_NS}tbl")):
+                parent = elem.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    # Paragraphs inside tables and text boxes are released
+                    # with their enclosing element
+                    continue
+                
+                if elem.tag == f"{_W_NS}p":
+                    text = _docx_paragraph_text(elem)
+                    if text and not text.isspace():
+                        yield text
+                
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+# Extension -> text extractor
+_PARSERS: Dict[str, Callable[[bytes, str], str]] = {
+    '.pdf': parse_pdf,
+    '.txt': parse_text,
+    '.md': parse_text,
+    '.docx': parse_docx,
+}
+
+
 def parse_document(content: bytes, filename: str) -> str:
     """Parse document and extract full text.
     
-    No chunking - returns complete document text for Gemini.
+    No chunking - returns complete document text for Gemini. Extracted
+    text is cached on disk by content hash, so re-uploads skip parsing.
     
     Args:
         content: Document bytes
@@ -151,16 +409,71 @@ def parse_document(content: bytes, filename: str) -> str:
         Full document text
     """
     ext = Path(filename).suffix.lower()
-    
-    if ext == '.pdf':
-        return parse_pdf(content, filename)
-    elif ext in ['.txt', '.md']:
-        return parse_text(content, filename)
-    elif ext == '.docx':
-        return parse_docx(content, filename)
-    else:
+    handler = _PARSERS.get(ext)
+    if handler is None:
         logger.warning(f"Unsupported file type: {ext}")
         return f"[Unsupported file type: {filename}]"
+    
+    cache_path = _parse_cache_path(content, ext)
+    try:
+        text = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)  # mark as recently used
+        return text
+    except OSError:
+        pass
+    
+    text = handler(content, filename)
+    
+    if not _is_failure_marker(text):
+        _write_parse_cache(cache_path, text)
+    return text
+
+
+def _parse_cache_path(content: bytes, ext: str) -> Path:
+    """Get the cache file for a document's extracted text."""
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return Path(get_settings().CACHE_DIR) / "parsed" / f"{digest}{ext}.txt"
+
+
+def _is_failure_marker(text: str) -> bool:
+    """Check for the bracketed placeholder returned when parsing fails."""
+    return text.startswith("[") and text.endswith("]") and "\n" not in text
+
+
+def _write_parse_cache(cache_path: Path, text: str) -> None:
+    """Atomically write parsed text to the cache, then trim old entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so concurrent readers never see a
+        # partial file and concurrent writers of the same key are harmless
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        entries = list(cache_path.parent.glob("*.txt"))
+        if len(entries) > PARSE_CACHE_MAX_FILES:
+            entries.sort(key=lambda path: path.stat().st_mtime)
+            for path in entries[:len(entries) - PARSE_CACHE_MAX_FILES]:
+                path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to cache parsed text: {e}")
+
+
+# Display labels for questionnaire keys; the key set is small and fixed
+_LABEL_CACHE: Dict[str, str] = {}
+
+
+def _label(key: str) -> str:
+    """Format a questionnaire key as a label, e.g. "company_name" -> "Company Name"."""
+    label = _LABEL_CACHE.get(key)
+    if label is None:
+        label = _LABEL_CACHE[key] = key.replace('_', ' ').title()
+    return label
 
 
 def load_startup_context(startup_id: str, db_service) -> str:
@@ -183,15 +496,11 @@ def load_startup_context(startup_id: str, db_service) -> str:
     if startup_data:
         responses = startup_data.get("questionnaire_responses", {})
         
-        context_parts.append("=== QUESTIONNAIRE RESPONSES ===\n")
-        
-        for key, value in responses.items():
-            if value:
-                # Format key nicely
-                label = key.replace('_', ' ').title()
-                context_parts.append(f"{label}: {value}")
-        
-        context_parts.append("\n")
+        context_parts = [
+            "=== QUESTIONNAIRE RESPONSES ===\n",
+            *(f"{_label(key)}: {value}" for key, value in responses.items() if value),
+            "\n"
+        ]
     
     # Get uploaded documents (from GCS or local)
     # TODO: Implement document retrieval from storage
@@ -1,7 +1,11 @@
 """Peer comparison service."""
 
+import os
+import tempfile
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from ..core.config import get_settings
@@ -9,6 +13,145 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+PEERS_CSV_PATH = Path("data/demo/peers.csv")
+
+# Metric -> CSV columns holding it, in order of preference (the shipped
+# cohort uses growth_rate/gross_margin; older mock files used short names)
+PEER_METRICS = {
+    "arr": ("arr",),
+    "growth": ("growth_rate", "growth"),
+    "margin": ("gross_margin", "margin"),
+}
+
+# Percentiles reported when the startup doesn't provide the metric
+DEFAULT_PERCENTILES = {"arr": 0.6, "growth": 0.7, "margin": 0.5}
+
+
+def _ensure_peers_csv(csv_path: Path) -> None:
+    """Write the demo peer cohort if no CSV exists yet."""
+    if csv_path.exists():
+        return
+    
+    mock_data = pd.DataFrame([
+        {"company": "Peer1", "arr": 5000000, "growth_rate": 2.5, "gross_margin": 0.7},
+        {"company": "Peer2", "arr": 8000000, "growth_rate": 2.0, "gross_margin": 0.75},
+        {"company": "Peer3", "arr": 3000000, "growth_rate": 3.0, "gross_margin": 0.65},
+    ])
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    mock_data.to_csv(csv_path, index=False)
+
+
+def _metric_columns(available: List[str]) -> Dict[str, str]:
+    """Map each peer metric to the first of its columns present in the file."""
+    resolved = {}
+    for metric, candidates in PEER_METRICS.items():
+        for column in candidates:
+            if column in available:
+                resolved[metric] = column
+                break
+    return resolved
+
+
+def _read_peer_columns(csv_path: Path) -> Tuple[int, Dict[str, np.ndarray]]:
+    """Read the peer row count and numeric metric columns.
+    
+    The CSV stays the editable source of truth. With pyarrow installed it
+    is converted once to a Feather (Arrow IPC) sidecar, which later loads
+    memory-map: numeric columns are read as-is without text parsing, and
+    the OS page cache is shared between workers. Any problem with the
+    sidecar falls back to reading the CSV.
+    
+    Returns:
+        Row count and metric columns present in the file, keyed by metric
+    """
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return _read_csv_columns(csv_path)
+    
+    feather_path = csv_path.with_suffix(".feather")
+    try:
+        if not feather_path.exists() or feather_path.stat().st_mtime < csv_path.stat().st_mtime:
+            _write_feather(pd.read_csv(csv_path), feather_path)
+        
+        table = feather.read_table(feather_path, memory_map=True)
+        return table.num_rows, {
+            metric: table.column(column).to_numpy().astype(float, copy=False)
+            for metric, column in _metric_columns(table.column_names).items()
+        }
+    except Exception as e:
+        logger.warning(f"Peer Feather sidecar unusable, reading CSV: {e}")
+        return _read_csv_columns(csv_path)
+
+
+def _read_csv_columns(csv_path: Path) -> Tuple[int, Dict[str, np.ndarray]]:
+    """Read the peer row count and metric columns straight from the CSV."""
+    df = pd.read_csv(csv_path)
+    return len(df), {
+        metric: df[column].to_numpy(dtype=float)
+        for metric, column in _metric_columns(list(df.columns)).items()
+    }
+
+
+def _write_feather(df: pd.DataFrame, feather_path: Path) -> None:
+    """Write the Feather sidecar through a temp file and rename.
+    
+    Concurrent workers never see a half-written file, and two workers
+    converting at once simply replace each other's identical output.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=feather_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            df.to_feather(f)
+        os.replace(tmp_path, feather_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _load_peers(csv_path: Path, mtime: float) -> Dict[str, Any]:
+    """Load the peer cohort once and precompute its statistics.
+    
+    `mtime` is part of the cache key so an edited CSV is picked up.
+    
+    Returns:
+        Row count, sorted metric columns and cohort quantiles
+    """
+    count, columns = _read_peer_columns(csv_path)
+    
+    sorted_columns = {
+        column: np.sort(values[~np.isnan(values)])
+        for column, values in columns.items()
+    }
+    
+    def _quantile(column: str, q: float) -> Optional[float]:
+        values = sorted_columns.get(column)
+        if values is None or not len(values):
+            return None
+        return float(np.quantile(values, q))
+    
+    return {
+        "count": count,
+        "sorted": sorted_columns,
+        "arr_q25": _quantile("arr", 0.25),
+        "arr_q50": _quantile("arr", 0.5),
+        "arr_q75": _quantile("arr", 0.75),
+        "growth_q50": _quantile("growth", 0.5),
+        "margin_q50": _quantile("margin", 0.5),
+    }
+
+
+def _percentile(sorted_values: Optional[np.ndarray], value: Any, default: float) -> float:
+    """Fraction of peers at or below `value` (binary search on sorted values)."""
+    if sorted_values is None or not len(sorted_values) or value is None:
+        return default
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return float(np.searchsorted(sorted_values, value, side="right")) / len(sorted_values)
+
 
 class PeerComparisonService:
     """Service for peer cohort analysis."""
@@ -40,27 +183,27 @@ class PeerComparisonService:
         Returns:
             Peer comparison data
         """
-        csv_path = Path("data/demo/peers.csv")
-        
-        if not csv_path.exists():
-            # Create mock data
-            mock_data = pd.DataFrame([
-                {"company": "Peer1", "arr": 5000000, "growth": 2.5, "margin": 0.7},
-                {"company": "Peer2", "arr": 8000000, "growth": 2.0, "margin": 0.75},
-                {"company": "Peer3", "arr": 3000000, "growth": 3.0, "margin": 0.65},
-            ])
-            csv_path.parent.mkdir(parents=True, exist_ok=True)
-            mock_data.to_csv(csv_path, index=False)
+        _ensure_peers_csv(PEERS_CSV_PATH)
+        peers = _load_peers(PEERS_CSV_PATH, PEERS_CSV_PATH.stat().st_mtime)
+        sorted_columns = peers["sorted"]
         
-        df = pd.read_csv(csv_path)
+        growth = startup_metrics.get("growth", startup_metrics.get("growth_rate"))
+        margin = startup_metrics.get("margin", startup_metrics.get("gross_margin"))
         
         return {
-            "percentile_arr": 0.6,
-            "percentile_growth": 0.7,
-            "percentile_margin": 0.5,
-            "peer_count": len(df),
-            "top_quartile_arr": 7500000,
-            "median_growth": 2.5
+            "percentile_arr": _percentile(
+                sorted_columns.get("arr"), startup_metrics.get("arr"), DEFAULT_PERCENTILES["arr"]
+            ),
+            "percentile_growth": _percentile(
+                sorted_columns.get("growth"), growth, DEFAULT_PERCENTILES["growth"]
+            ),
+            "percentile_margin": _percentile(
+                sorted_columns.get("margin"), margin, DEFAULT_PERCENTILES["margin"]
+            ),
+            "peer_count": peers["count"],
+            "top_quartile_arr": peers["arr_q75"] if peers["arr_q75"] is not None else 7500000,
+            "median_growth": peers["growth_q50"] if peers["growth_q50"] is not None else 2.5,
+            "median_margin": peers["margin_q50"] if peers["margin_q50"] is not None else 0.7
         }
     
     async def _get_bigquery_peers(self, startup_metrics: Dict[str, Any]) -> Dict[str, Any]:
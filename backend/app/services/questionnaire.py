@@ -1,7 +1,12 @@
 """Interactive questionnaire service for guided data collection."""
 
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import json
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 
 from ..core.logging import get_logger
@@ -11,6 +16,23 @@ from .generator import GeminiGenerator
 logger = get_logger(__name__)
 
 
+# Generated summaries kept per questionnaire instance (LRU)
+SUMMARY_CACHE_MAX_ENTRIES = 256
+
+# Substrings of numeric question IDs displayed as dollar amounts
+_CURRENCY_ID_KEYS = ("arr", "mrr", "cac", "ltv", "valuation", "raised", "burn", "tam")
+
+
+def _as_number(answer: Any) -> Optional[float]:
+    """Convert an answer to float, or None if it isn't numeric."""
+    if isinstance(answer, (int, float)):
+        return float(answer)
+    try:
+        return float(answer)
+    except (ValueError, TypeError):
+        return None
+
+
 class QuestionType(str, Enum):
     """Question types for different response formats."""
     TEXT = "text"
@@ -23,9 +45,12 @@ class QuestionType(str, Enum):
     URL = "url"
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
-    """Questionnaire question definition."""
+    """Questionnaire question definition.
+    
+    Slotted: instances carry no per-instance __dict__.
+    """
     id: str
     text: str
     type: QuestionType
@@ -35,6 +60,413 @@ class Question:
     validation: Dict[str, Any] = None
     follow_up: Optional[str] = None  # ID of follow-up question
     depends_on: Optional[Tuple[str, Any]] = None  # (question_id, answer_value)
+    format_kind: str = "plain"  # numeric display: "percent", "currency" or "plain"
+    option_set: frozenset = frozenset()  # options for O(1) membership checks
+    options_msg: str = ""  # validation error listing the options
+
+
+_YES_NO_ANSWERS = frozenset(("yes", "no", "true", "false"))
+
+
+def _validate_number(question: Question, answer: Any) -> Tuple[bool, str]:
+    """Validate a numeric answer against optional min/max bounds."""
+    try:
+        value = float(answer)
+    except (ValueError, TypeError):
+        return False, "Please enter a valid number"
+    
+    if question.validation:
+        if "min" in question.validation and value < question.validation["min"]:
+            return False, f"Value must be at least {question.validation['min']}"
+        if "max" in question.validation and value > question.validation["max"]:
+            return False, f"Value must be at most {question.validation['max']}"
+    return True, ""
+
+
+def _validate_choice(question: Question, answer: Any) -> Tuple[bool, str]:
+    """Validate a single-choice answer against the question's options."""
+    try:
+        valid = not question.option_set or answer in question.option_set
+    except TypeError:  # unhashable answer (e.g. a list) can't be an option
+        valid = False
+    if not valid:
+        return False, question.options_msg
+    return True, ""
+
+
+def _validate_yes_no(question: Question, answer: Any) -> Tuple[bool, str]:
+    """Validate a yes/no answer."""
+    if str(answer).lower() not in _YES_NO_ANSWERS:
+        return False, "Please answer yes or no"
+    return True, ""
+
+
+def _validate_url(question: Question, answer: Any) -> Tuple[bool, str]:
+    """Validate an http(s) URL answer."""
+    if answer and not answer.startswith(("http://", "https://")):
+        return False, "Please enter a valid URL"
+    return True, ""
+
+
+# Per-type answer validators; other types accept any answer
+_VALIDATORS = {
+    QuestionType.NUMBER: _validate_number,
+    QuestionType.CHOICE: _validate_choice,
+    QuestionType.YES_NO: _validate_yes_no,
+    QuestionType.URL: _validate_url,
+}
+
+
+def _index_by_category(questions: Tuple[Question, ...]) -> Dict[str, Tuple[Question, ...]]:
+    """Group questions by category, keeping definition order.
+    
+    Args:
+        questions: Questions in definition order
+        
+    Returns:
+        Questions per category
+    """
+    by_category: Dict[str, List[Question]] = {}
+    for question in questions:
+        by_category.setdefault(question.category, []).append(question)
+    return {category: tuple(qs) for category, qs in by_category.items()}
+
+
+def _build_question_tree() -> Dict[str, Question]:
+    """Build the question tree for investment analysis.
+    
+    Returns:
+        Dictionary of questions by ID
+    """
+    questions = {
+        # Company Overview
+        "company_name": Question(
+            id="company_name",
+            text="What is your company name?",
+            type=QuestionType.TEXT,
+            category="overview"
+        ),
+        "founding_year": Question(
+            id="founding_year",
+            text="When was your company founded?",
+            type=QuestionType.NUMBER,
+            category="overview",
+            validation={"min": 1900, "max": 2024}
+        ),
+        "industry": Question(
+            id="industry",
+            text="What industry/vertical are you in?",
+            type=QuestionType.CHOICE,
+            category="overview",
+            options=["SaaS", "Fintech", "Healthcare", "E-commerce", "AI/ML", "Marketplace", "Hardware", "Other"]
+        ),
+        "business_model": Question(
+            id="business_model",
+            text="What's your primary business model?",
+            type=QuestionType.CHOICE,
+            category="overview",
+            options=["B2B SaaS", "B2C Subscription", "Marketplace", "Transaction-based", "Enterprise", "Freemium", "Other"]
+        ),
+        
+        # Financial Metrics
+        "arr": Question(
+            id="arr",
+            text="What is your current Annual Recurring Revenue (ARR)?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": 0}
+        ),
+        "mrr": Question(
+            id="mrr",
+            text="What is your current Monthly Recurring Revenue (MRR)?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": 0}
+        ),
+        "growth_rate": Question(
+            id="growth_rate",
+            text="What is your year-over-year revenue growth rate (as a percentage)?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": -100, "max": 1000}
+        ),
+        "gross_margin": Question(
+            id="gross_margin",
+            text="What is your gross margin percentage?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": 0, "max": 100}
+        ),
+        "burn_rate": Question(
+            id="burn_rate",
+            text="What is your monthly burn rate?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": 0}
+        ),
+        "runway": Question(
+            id="runway",
+            text="How many months of runway do you have?",
+            type=QuestionType.NUMBER,
+            category="financials",
+            validation={"min": 0, "max": 120}
+        ),
+        
+        # Additional Company Details for UI
+        "company_description": Question(
+            id="company_description",
+            text="Describe your company in one sentence",
+            type=QuestionType.TEXT,
+            category="overview"
+        ),
+        "headquarters": Question(
+            id="headquarters",
+            text="Where is your headquarters? (City, Country)",
+            type=QuestionType.TEXT,
+            category="overview"
+        ),
+        "target_markets": Question(
+            id="target_markets",
+            text="What are your target markets? (comma-separated)",
+            type=QuestionType.TEXT,
+            category="overview"
+        ),
+        
+        # Customer Metrics
+        "total_customers": Question(
+            id="total_customers",
+            text="How many paying customers do you have?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0}
+        ),
+        "fortune_500_customers": Question(
+            id="fortune_500_customers",
+            text="How many Fortune 500 customers do you have?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0}
+        ),
+        "churn_rate": Question(
+            id="churn_rate",
+            text="What is your monthly churn rate (percentage)?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0, "max": 100}
+        ),
+        "logo_retention": Question(
+            id="logo_retention",
+            text="What is your annual logo retention rate (percentage)?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0, "max": 100}
+        ),
+        "nrr": Question(
+            id="nrr",
+            text="What is your Net Revenue Retention (NRR) percentage?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0, "max": 300}
+        ),
+        "cac": Question(
+            id="cac",
+            text="What is your Customer Acquisition Cost (CAC)?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0}
+        ),
+        "ltv": Question(
+            id="ltv",
+            text="What is your customer Lifetime Value (LTV)?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0}
+        ),
+        "customer_concentration": Question(
+            id="customer_concentration",
+            text="What percentage of revenue comes from your top 10 customers?",
+            type=QuestionType.NUMBER,
+            category="customers",
+            validation={"min": 0, "max": 100}
+        ),
+        
+        # Team & Founders - ESSENTIAL FOR UI
+        "team_size": Question(
+            id="team_size",
+            text="How many full-time employees do you have?",
+            type=QuestionType.NUMBER,
+            category="team",
+            validation={"min": 1}
+        ),
+        "founder_names": Question(
+            id="founder_names",
+            text="List founder names and roles (e.g., 'John Doe - CEO, Jane Smith - CTO')",
+            type=QuestionType.TEXT,
+            category="team"
+        ),
+        "founder_experience": Question(
+            id="founder_experience",
+            text="Do founders have prior exit experience? (Yes/No)",
+            type=QuestionType.CHOICE,
+            category="team",
+            options=["Yes", "No"]
+        ),
+        "team_from_faang": Question(
+            id="team_from_faang",
+            text="How many team members are from FAANG/top tech companies?",
+            type=QuestionType.NUMBER,
+            category="team",
+            validation={"min": 0}
+        ),
+        "technical_team": Question(
+            id="technical_team",
+            text="What percentage of your team is technical/engineering?",
+            type=QuestionType.NUMBER,
+            category="team",
+            validation={"min": 0, "max": 100}
+        ),
+        
+        # Funding & Investment - ESSENTIAL FOR UI
+        "funding_stage": Question(
+            id="funding_stage",
+            text="What is your current funding stage?",
+            type=QuestionType.CHOICE,
+            category="funding",
+            options=["Pre-seed", "Seed", "Series A", "Series B", "Series C+", "Bootstrapped"]
+        ),
+        "total_raised": Question(
+            id="total_raised",
+            text="Total funding raised to date (in USD)?",
+            type=QuestionType.NUMBER,
+            category="funding",
+            validation={"min": 0}
+        ),
+        "last_valuation": Question(
+            id="last_valuation",
+            text="Last valuation (in USD)?",
+            type=QuestionType.NUMBER,
+            category="funding",
+            validation={"min": 0}
+        ),
+        "current_ask": Question(
+            id="current_ask",
+            text="How much are you raising now (in USD)?",
+            type=QuestionType.NUMBER,
+            category="funding",
+            validation={"min": 0}
+        ),
+        "target_valuation": Question(
+            id="target_valuation",
+            text="Target valuation for this round (in USD)?",
+            type=QuestionType.NUMBER,
+            category="funding",
+            validation={"min": 0}
+        ),
+        "use_of_funds": Question(
+            id="use_of_funds",
+            text="Primary use of funds (e.g., '50% marketing, 30% product, 20% hiring')",
+            type=QuestionType.TEXT,
+            category="funding"
+        ),
+        "exit_strategy": Question(
+            id="exit_strategy",
+            text="Exit strategy (e.g., 'IPO in 5 years' or 'Acquisition by enterprise player')",
+            type=QuestionType.TEXT,
+            category="funding"
+        ),
+        "investor_names": Question(
+            id="investor_names",
+            text="Current investors (comma-separated, e.g., 'Y Combinator, Sequoia Capital')",
+            type=QuestionType.TEXT,
+            category="funding"
+        ),
+        
+        # Product & Market
+        "product_stage": Question(
+            id="product_stage",
+            text="What stage is your product in?",
+            type=QuestionType.CHOICE,
+            category="product",
+            options=["Idea", "MVP", "Beta", "Launched", "Growing", "Scaling"]
+        ),
+        "competitive_advantage": Question(
+            id="competitive_advantage",
+            text="What is your main competitive advantage?",
+            type=QuestionType.TEXT,
+            category="product",
+            required=False
+        ),
+        "tam": Question(
+            id="tam",
+            text="What is your Total Addressable Market (TAM) in dollars?",
+            type=QuestionType.NUMBER,
+            category="market",
+            validation={"min": 0}
+        ),
+        
+        # Fundraising
+        "previous_funding": Question(
+            id="previous_funding",
+            text="How much funding have you raised to date?",
+            type=QuestionType.NUMBER,
+            category="fundraising",
+            validation={"min": 0}
+        ),
+        "current_round": Question(
+            id="current_round",
+            text="How much are you raising in this round?",
+            type=QuestionType.NUMBER,
+            category="fundraising",
+            validation={"min": 0}
+        ),
+        "valuation": Question(
+            id="valuation",
+            text="What is your target valuation?",
+            type=QuestionType.NUMBER,
+            category="fundraising",
+            validation={"min": 0},
+            required=False
+        ),
+        
+        # Additional Context
+        "pitch_deck_url": Question(
+            id="pitch_deck_url",
+            text="Do you have a pitch deck URL to share? (optional)",
+            type=QuestionType.URL,
+            category="documents",
+            required=False
+        ),
+        "financial_model_url": Question(
+            id="financial_model_url",
+            text="Do you have a financial model to share? (optional)",
+            type=QuestionType.URL,
+            category="documents",
+            required=False
+        )
+    }
+    
+    # Classify numeric display and prepare option checks once
+    for question in questions.values():
+        if question.options:
+            question.option_set = frozenset(question.options)
+            question.options_msg = f"Please select one of: {', '.join(question.options)}"
+        
+        if question.type == QuestionType.NUMBER:
+            if "rate" in question.id or "margin" in question.id:
+                question.format_kind = "percent"
+            elif any(key in question.id for key in _CURRENCY_ID_KEYS):
+                question.format_kind = "currency"
+    
+    return questions
+
+
+# Question table built once per process and shared (read-only) by every
+# InvestmentQuestionnaire instance
+_QUESTIONS: Mapping[str, Question] = MappingProxyType(_build_question_tree())
+_ORDERED_QUESTIONS: Tuple[Question, ...] = tuple(_QUESTIONS.values())
+_BY_CATEGORY: Mapping[str, Tuple[Question, ...]] = MappingProxyType(
+    _index_by_category(_ORDERED_QUESTIONS)
+)
 
 
 class InvestmentQuestionnaire:
@@ -42,323 +474,15 @@ class InvestmentQuestionnaire:
     
     def __init__(self):
         """Initialize questionnaire with predefined questions."""
-        self.questions = self._build_question_tree()
-        self.generator = GeminiGenerator()
+        self.questions = _QUESTIONS
+        self._ordered_questions = _ORDERED_QUESTIONS
+        self._by_category = _BY_CATEGORY
+        self._summary_cache: "OrderedDict[bytes, str]" = OrderedDict()
     
-    def _build_question_tree(self) -> Dict[str, Question]:
-        """Build the question tree for investment analysis.
-        
-        Returns:
-            Dictionary of questions by ID
-        """
-        questions = {
-            # Company Overview
-            "company_name": Question(
-                id="company_name",
-                text="What is your company name?",
-                type=QuestionType.TEXT,
-                category="overview"
-            ),
-            "founding_year": Question(
-                id="founding_year",
-                text="When was your company founded?",
-                type=QuestionType.NUMBER,
-                category="overview",
-                validation={"min": 1900, "max": 2024}
-            ),
-            "industry": Question(
-                id="industry",
-                text="What industry/vertical are you in?",
-                type=QuestionType.CHOICE,
-                category="overview",
-                options=["SaaS", "Fintech", "Healthcare", "E-commerce", "AI/ML", "Marketplace", "Hardware", "Other"]
-            ),
-            "business_model": Question(
-                id="business_model",
-                text="What's your primary business model?",
-                type=QuestionType.CHOICE,
-                category="overview",
-                options=["B2B SaaS", "B2C Subscription", "Marketplace", "Transaction-based", "Enterprise", "Freemium", "Other"]
-            ),
-            
-            # Financial Metrics
-            "arr": Question(
-                id="arr",
-                text="What is your current Annual Recurring Revenue (ARR)?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": 0}
-            ),
-            "mrr": Question(
-                id="mrr",
-                text="What is your current Monthly Recurring Revenue (MRR)?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": 0}
-            ),
-            "growth_rate": Question(
-                id="growth_rate",
-                text="What is your year-over-year revenue growth rate (as a percentage)?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": -100, "max": 1000}
-            ),
-            "gross_margin": Question(
-                id="gross_margin",
-                text="What is your gross margin percentage?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": 0, "max": 100}
-            ),
-            "burn_rate": Question(
-                id="burn_rate",
-                text="What is your monthly burn rate?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": 0}
-            ),
-            "runway": Question(
-                id="runway",
-                text="How many months of runway do you have?",
-                type=QuestionType.NUMBER,
-                category="financials",
-                validation={"min": 0, "max": 120}
-            ),
-            
-            # Additional Company Details for UI
-            "company_description": Question(
-                id="company_description",
-                text="Describe your company in one sentence",
-                type=QuestionType.TEXT,
-                category="overview"
-            ),
-            "headquarters": Question(
-                id="headquarters",
-                text="Where is your headquarters? (City, Country)",
-                type=QuestionType.TEXT,
-                category="overview"
-            ),
-            "target_markets": Question(
-                id="target_markets",
-                text="What are your target markets? (comma-separated)",
-                type=QuestionType.TEXT,
-                category="overview"
-            ),
-            
-            # Customer Metrics
-            "total_customers": Question(
-                id="total_customers",
-                text="How many paying customers do you have?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0}
-            ),
-            "fortune_500_customers": Question(
-                id="fortune_500_customers",
-                text="How many Fortune 500 customers do you have?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0}
-            ),
-            "churn_rate": Question(
-                id="churn_rate",
-                text="What is your monthly churn rate (percentage)?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0, "max": 100}
-            ),
-            "logo_retention": Question(
-                id="logo_retention",
-                text="What is your annual logo retention rate (percentage)?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0, "max": 100}
-            ),
-            "nrr": Question(
-                id="nrr",
-                text="What is your Net Revenue Retention (NRR) percentage?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0, "max": 300}
-            ),
-            "cac": Question(
-                id="cac",
-                text="What is your Customer Acquisition Cost (CAC)?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0}
-            ),
-            "ltv": Question(
-                id="ltv",
-                text="What is your customer Lifetime Value (LTV)?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0}
-            ),
-            "customer_concentration": Question(
-                id="customer_concentration",
-                text="What percentage of revenue comes from your top 10 customers?",
-                type=QuestionType.NUMBER,
-                category="customers",
-                validation={"min": 0, "max": 100}
-            ),
-            
-            # Team & Founders - ESSENTIAL FOR UI
-            "team_size": Question(
-                id="team_size",
-                text="How many full-time employees do you have?",
-                type=QuestionType.NUMBER,
-                category="team",
-                validation={"min": 1}
-            ),
-            "founder_names": Question(
-                id="founder_names",
-                text="List founder names and roles (e.g., 'John Doe - CEO, Jane Smith - CTO')",
-                type=QuestionType.TEXT,
-                category="team"
-            ),
-            "founder_experience": Question(
-                id="founder_experience",
-                text="Do founders have prior exit experience? (Yes/No)",
-                type=QuestionType.CHOICE,
-                category="team",
-                options=["Yes", "No"]
-            ),
-            "team_from_faang": Question(
-                id="team_from_faang",
-                text="How many team members are from FAANG/top tech companies?",
-                type=QuestionType.NUMBER,
-                category="team",
-                validation={"min": 0}
-            ),
-            "technical_team": Question(
-                id="technical_team",
-                text="What percentage of your team is technical/engineering?",
-                type=QuestionType.NUMBER,
-                category="team",
-                validation={"min": 0, "max": 100}
-            ),
-            
-            # Funding & Investment - ESSENTIAL FOR UI
-            "funding_stage": Question(
-                id="funding_stage",
-                text="What is your current funding stage?",
-                type=QuestionType.CHOICE,
-                category="funding",
-                options=["Pre-seed", "Seed", "Series A", "Series B", "Series C+", "Bootstrapped"]
-            ),
-            "total_raised": Question(
-                id="total_raised",
-                text="Total funding raised to date (in USD)?",
-                type=QuestionType.NUMBER,
-                category="funding",
-                validation={"min": 0}
-            ),
-            "last_valuation": Question(
-                id="last_valuation",
-                text="Last valuation (in USD)?",
-                type=QuestionType.NUMBER,
-                category="funding",
-                validation={"min": 0}
-            ),
-            "current_ask": Question(
-                id="current_ask",
-                text="How much are you raising now (in USD)?",
-                type=QuestionType.NUMBER,
-                category="funding",
-                validation={"min": 0}
-            ),
-            "target_valuation": Question(
-                id="target_valuation",
-                text="Target valuation for this round (in USD)?",
-                type=QuestionType.NUMBER,
-                category="funding",
-                validation={"min": 0}
-            ),
-            "use_of_funds": Question(
-                id="use_of_funds",
-                text="Primary use of funds (e.g., '50% marketing, 30% product, 20% hiring')",
-                type=QuestionType.TEXT,
-                category="funding"
-            ),
-            "exit_strategy": Question(
-                id="exit_strategy",
-                text="Exit strategy (e.g., 'IPO in 5 years' or 'Acquisition by enterprise player')",
-                type=QuestionType.TEXT,
-                category="funding"
-            ),
-            "investor_names": Question(
-                id="investor_names",
-                text="Current investors (comma-separated, e.g., 'Y Combinator, Sequoia Capital')",
-                type=QuestionType.TEXT,
-                category="funding"
-            ),
-            
-            # Product & Market
-            "product_stage": Question(
-                id="product_stage",
-                text="What stage is your product in?",
-                type=QuestionType.CHOICE,
-                category="product",
-                options=["Idea", "MVP", "Beta", "Launched", "Growing", "Scaling"]
-            ),
-            "competitive_advantage": Question(
-                id="competitive_advantage",
-                text="What is your main competitive advantage?",
-                type=QuestionType.TEXT,
-                category="product",
-                required=False
-            ),
-            "tam": Question(
-                id="tam",
-                text="What is your Total Addressable Market (TAM) in dollars?",
-                type=QuestionType.NUMBER,
-                category="market",
-                validation={"min": 0}
-            ),
-            
-            # Fundraising
-            "previous_funding": Question(
-                id="previous_funding",
-                text="How much funding have you raised to date?",
-                type=QuestionType.NUMBER,
-                category="fundraising",
-                validation={"min": 0}
-            ),
-            "current_round": Question(
-                id="current_round",
-                text="How much are you raising in this round?",
-                type=QuestionType.NUMBER,
-                category="fundraising",
-                validation={"min": 0}
-            ),
-            "valuation": Question(
-                id="valuation",
-                text="What is your target valuation?",
-                type=QuestionType.NUMBER,
-                category="fundraising",
-                validation={"min": 0},
-                required=False
-            ),
-            
-            # Additional Context
-            "pitch_deck_url": Question(
-                id="pitch_deck_url",
-                text="Do you have a pitch deck URL to share? (optional)",
-                type=QuestionType.URL,
-                category="documents",
-                required=False
-            ),
-            "financial_model_url": Question(
-                id="financial_model_url",
-                text="Do you have a financial model to share? (optional)",
-                type=QuestionType.URL,
-                category="documents",
-                required=False
-            )
-        }
-        
-        return questions
+    @cached_property
+    def generator(self) -> GeminiGenerator:
+        """LLM generator, created on first use (only summaries need it)."""
+        return GeminiGenerator()
     
     def get_questions_by_category(self, category: str) -> List[Question]:
         """Get all questions for a category.
@@ -369,7 +493,7 @@ class InvestmentQuestionnaire:
         Returns:
             List of questions
         """
-        return [q for q in self.questions.values() if q.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_next_question(
         self,
@@ -385,15 +509,13 @@ class InvestmentQuestionnaire:
         Returns:
             Next question or None if complete
         """
-        for question in self.questions.values():
+        candidates = self._by_category.get(category, ()) if category else self._ordered_questions
+        
+        for question in candidates:
             # Skip if already answered
             if question.id in answered:
                 continue
             
-            # Check category filter
-            if category and question.category != category:
-                continue
-            
             # Check dependencies
             if question.depends_on:
                 dep_id, dep_value = question.depends_on
@@ -414,31 +536,60 @@ class InvestmentQuestionnaire:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Type validation
-        if question.type == QuestionType.NUMBER:
-            try:
-                value = float(answer)
-                if question.validation:
-                    if "min" in question.validation and value < question.validation["min"]:
-                        return False, f"Value must be at least {question.validation['min']}"
-                    if "max" in question.validation and value > question.validation["max"]:
-                        return False, f"Value must be at most {question.validation['max']}"
-            except (ValueError, TypeError):
-                return False, "Please enter a valid number"
-        
-        elif question.type == QuestionType.CHOICE:
-            if question.options and answer not in question.options:
-                return False, f"Please select one of: {', '.join(question.options)}"
-        
-        elif question.type == QuestionType.YES_NO:
-            if str(answer).lower() not in ["yes", "no", "true", "false"]:
-                return False, "Please answer yes or no"
-        
-        elif question.type == QuestionType.URL:
-            if answer and not (answer.startswith("http://") or answer.startswith("https://")):
-                return False, "Please enter a valid URL"
-        
-        return True, ""
+        validator = _VALIDATORS.get(question.type)
+        if validator is None:
+            return True, ""
+        return validator(question, answer)
+    
+    def _group_responses_by_category(
+        self,
+        responses: Dict[str, Any],
+        all_lines: Optional[List[str]] = None
+    ) -> Dict[str, List[Tuple[Question, Any]]]:
+        """Group answered questions by category in one pass.
+        
+        Categories and answers keep the order of `responses`; unknown
+        question IDs are skipped. Shared by both chunk builders.
+        
+        Args:
+            responses: Question responses
+            all_lines: If given, also receives a "key: value" line for every
+                response (including unknown IDs) in the same pass
+            
+        Returns:
+            (question, answer) pairs per category
+        """
+        grouped = defaultdict(list)
+        questions = self.questions
+        for q_id, answer in responses.items():
+            if all_lines is not None:
+                all_lines.append(f"{q_id}: {answer}")
+            question = questions.get(q_id)
+            if question:
+                grouped[question.category].append((question, answer))
+        return grouped
+    
+    @staticmethod
+    def _format_answer(question: Question, answer: Any) -> str:
+        """Format an answer for display using the question's format kind.
+        
+        Args:
+            question: Question answered
+            answer: Provided answer
+            
+        Returns:
+            Display value, e.g. "20%" or "$1,000,000"
+        """
+        kind = question.format_kind
+        if kind != "plain":
+            # Non-numeric answers fall back to plain text
+            numeric_answer = _as_number(answer)
+            if numeric_answer is not None:
+                if kind == "percent":
+                    return f"{answer}%"
+                if kind == "currency":
+                    return f"${numeric_answer:,.0f}"
+        return str(answer)
     
     def convert_to_chunks(
         self,
@@ -456,14 +607,7 @@ class InvestmentQuestionnaire:
         """
         chunks = []
         
-        # Group by category
-        categories = {}
-        for q_id, answer in responses.items():
-            if q_id in self.questions:
-                question = self.questions[q_id]
-                if question.category not in categories:
-                    categories[question.category] = []
-                categories[question.category].append((question, answer))
+        categories = self._group_responses_by_category(responses)
         
         # Create chunks per category
         chunk_id = 0
@@ -472,20 +616,7 @@ class InvestmentQuestionnaire:
             text_parts = [f"# {category.title()} Information\n"]
             
             for question, answer in qa_pairs:
-                # Format based on type
-                if question.type == QuestionType.NUMBER:
-                    try:
-                        numeric_answer = float(answer)
-                        if "rate" in question.id or "margin" in question.id:
-                            text_parts.append(f"{question.text} {answer}%")
-                        elif "arr" in question.id or "mrr" in question.id or "cac" in question.id:
-                            text_parts.append(f"{question.text} ${numeric_answer:,.0f}")
-                        else:
-                            text_parts.append(f"{question.text} {answer}")
-                    except (ValueError, TypeError):
-                        text_parts.append(f"{question.text} {answer}")
-                else:
-                    text_parts.append(f"{question.text} {answer}")
+                text_parts.append(f"{question.text} {self._format_answer(question, answer)}")
             
             chunk_text = "\n".join(text_parts)
             
@@ -518,12 +649,25 @@ class InvestmentQuestionnaire:
         Returns:
             Executive summary
         """
+        # Identical answer sets (retries, re-analysis) reuse the generated summary
+        cache_key = hashlib.blake2b(
+            json.dumps(responses, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).digest()
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            self._summary_cache.move_to_end(cache_key)
+            return cached
+        
         # Build context
-        context = "Company Information:\n"
+        questions = self.questions
+        lines = ["Company Information:"]
         for q_id, answer in responses.items():
-            if q_id in self.questions:
-                question = self.questions[q_id]
-                context += f"- {question.text} {answer}\n"
+            question = questions.get(q_id)
+            if question:
+                lines.append(f"- {question.text} {answer}")
+        lines.append("")  # keep the trailing newline
+        context = "\n".join(lines)
         
         prompt = f"""
         Based on the following information provided via questionnaire, 
@@ -536,6 +680,9 @@ class InvestmentQuestionnaire:
         
         if self.generator.model:
             response = await self.generator._generate(prompt, temperature=0.3)
+            self._summary_cache[cache_key] = response
+            if len(self._summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+                self._summary_cache.popitem(last=False)
             return response
         else:
             # Mock response
@@ -546,19 +693,13 @@ class InvestmentQuestionnaire:
         from ..models.dto import Chunk
         chunks = []
         
-        # Group responses by category
-        categories = {}
-        for key, value in responses.items():
-            question = self.questions.get(key)
-            if question:
-                category = question.category
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(f"{question.text}: {value}")
+        # One pass: per-category pairs and the comprehensive chunk's lines
+        all_parts = []
+        categories = self._group_responses_by_category(responses, all_parts)
         
         # Create chunks for each category
-        for category, items in categories.items():
-            content = "\n".join(items)
+        for category, qa_pairs in categories.items():
+            content = "\n".join(f"{question.text}: {value}" for question, value in qa_pairs)
             chunk = Chunk(
                 chunk_id=f"{startup_id}_questionnaire_{category}",
                 content=content,
@@ -572,7 +713,7 @@ class InvestmentQuestionnaire:
             chunks.append(chunk)
         
         # Also create one comprehensive chunk
-        all_content = "\n\n".join([f"{k}: {v}" for k, v in responses.items()])
+        all_content = "\n\n".join(all_parts)
         chunks.append(Chunk(
             chunk_id=f"{startup_id}_questionnaire_all",
             content=all_content,
@@ -1,9 +1,17 @@
 """Hybrid retrieval service combining vector and BM25 search."""
 
-from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import json
+import os
+import re
+import tempfile
+import zipfile
+from typing import IO, Callable, List, Dict, Any, NamedTuple, Optional, Tuple
 import numpy as np
-from collections import defaultdict
-import math
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 
 from ..models.dto import DocumentChunk, Evidence, DocumentType
 from ..core.config import get_settings
@@ -14,6 +22,118 @@ from .index import get_index, SearchResult
 logger = get_logger(__name__)
 
 
+# Chunks are tokenized at most once per process: a HybridRetriever reindexes
+# the stored chunks on construction and then again when ingest hands it the
+# same chunks, and every request builds a fresh retriever.
+TOKEN_CACHE_MAX_CHUNKS = 16384
+
+# Common stopwords
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'shall', 'it', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'we', 'they', 'them'
+})
+
+# Whole words of three or more characters; shorter tokens are never indexed
+_TOKEN_RE = re.compile(r'\b\w{3,}\b')
+
+
+def _tokenize(text: str) -> List[str]:
+    """Advanced tokenization with stopword removal.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        List of tokens
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+@lru_cache(maxsize=TOKEN_CACHE_MAX_CHUNKS)
+def _token_counts(text: str) -> Counter:
+    """Term counts of a chunk's text, cached by text.
+    
+    The returned Counter is shared between callers and must not be mutated.
+    
+    Args:
+        text: Chunk text
+        
+    Returns:
+        Counter of token -> term frequency
+    """
+    return Counter(_tokenize(text))
+
+
+def _atomic_write(path: Path, write: Callable[[IO], None], mode: str = "wb") -> None:
+    """Write a file through a temp file and rename, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _top_k(ids: List[str], scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+    """Select the k highest-scoring IDs, sorting only the selected ones.
+    
+    Args:
+        ids: Candidate IDs
+        scores: Scores aligned with ids
+        k: Number of results
+        
+    Returns:
+        Up to k (id, score) tuples, best first
+    """
+    if scores.size > k:
+        selected = np.argpartition(-scores, k)[:k]
+    else:
+        selected = np.arange(scores.size)
+    selected = selected[np.argsort(-scores[selected], kind="stable")]
+    return [(ids[i], float(scores[i])) for i in selected]
+
+
+class _IndexedDoc(NamedTuple):
+    """A Chunk or DocumentChunk reduced to what indexing needs."""
+    id: str
+    text: str
+    meta: Dict[str, Any]
+
+
+def _normalize_doc(doc: Any) -> _IndexedDoc:
+    """Read the ID, text and vector metadata of a Chunk or DocumentChunk once.
+    
+    Args:
+        doc: Chunk (chunk_id/content) or DocumentChunk (id/text/type/source)
+        
+    Returns:
+        Normalized document
+    """
+    doc_id = getattr(doc, 'chunk_id', None) or getattr(doc, 'id', None) or str(id(doc))
+    text = getattr(doc, 'text', None)
+    if text is None:
+        text = getattr(doc, 'content', "")
+    
+    meta = {'text': text}
+    doc_type = getattr(doc, 'type', None)
+    if doc_type is not None:
+        meta['type'] = doc_type.value if hasattr(doc_type, 'value') else str(doc_type)
+    source = getattr(doc, 'source', None)
+    if source is not None:
+        meta['source'] = source
+    doc_metadata = getattr(doc, 'metadata', None)
+    if doc_metadata is not None:
+        meta['metadata'] = doc_metadata
+    
+    return _IndexedDoc(doc_id, text, meta)
+
+
 class BM25Retriever:
     """BM25 keyword-based retrieval."""
     
@@ -26,136 +146,197 @@ class BM25Retriever:
         """
         self.k1 = k1
         self.b = b
-        self.doc_freqs = defaultdict(int)
-        self.doc_lens = {}
         self.avg_doc_len = 0
         self.total_docs = 0
-        self.inverted_index = defaultdict(set)
-        self.documents = {}
+        # Term -> term ID, and document index -> document ID
+        self.vocab: Dict[str, int] = {}
+        self.doc_ids: List[str] = []
+        # Parallel arrays indexed by document index / term ID
+        self.doc_lens = np.zeros(0, dtype=np.int32)
+        self.idf = np.zeros(0, dtype=np.float32)
+        # Term-major postings: term t's documents and precomputed BM25
+        # weights are postings_docs/postings_weights[indptr[t]:indptr[t + 1]]
+        self.postings_indptr = np.zeros(1, dtype=np.int64)
+        self.postings_docs = np.zeros(0, dtype=np.int32)
+        self.postings_weights = np.zeros(0, dtype=np.float32)
     
     def index_documents(self, documents: List[DocumentChunk]):
         """Index documents for BM25 search.
         
+        Every (document, term) BM25 weight is computed here once, so a
+        query only has to sum the posting lists of its own terms.
+        
         Args:
-            documents: List of document chunks
+            documents: List of document chunks, raw or already normalized
         """
-        # Handle both Chunk and DocumentChunk types
-        if documents:
-            if hasattr(documents[0], 'chunk_id'):
-                # It's a Chunk object
-                self.documents = {doc.chunk_id: doc for doc in documents}
-            else:
-                # It's a DocumentChunk object
-                self.documents = {doc.id: doc for doc in documents}
-        else:
-            self.documents = {}
         self.total_docs = len(documents)
-        
-        # Calculate document frequencies and lengths
-        total_len = 0
-        for doc in documents:
-            # Handle both Chunk and DocumentChunk
-            text = doc.text if hasattr(doc, 'text') else doc.content if hasattr(doc, 'content') else ""
-            tokens = self._tokenize(text)
-            doc_len = len(tokens)
-            # Get document ID
-            doc_id = doc.chunk_id if hasattr(doc, 'chunk_id') else doc.id if hasattr(doc, 'id') else str(id(doc))
-            self.doc_lens[doc_id] = doc_len
-            total_len += doc_len
+        self.vocab = {}
+        self.doc_ids = []
+        
+        # Collect (document, term, tf) triplets and document lengths
+        rows, cols, tfs, lens = [], [], [], []
+        for row, doc in enumerate(documents):
+            # Handle both Chunk and DocumentChunk, unless already normalized
+            if not isinstance(doc, _IndexedDoc):
+                doc = _normalize_doc(doc)
+            counts = _token_counts(doc.text)
+            self.doc_ids.append(doc.id)
+            lens.append(sum(counts.values()))
             
-            # Update document frequencies
-            unique_tokens = set(tokens)
-            for token in unique_tokens:
-                self.doc_freqs[token] += 1
-                self.inverted_index[token].add(doc_id)
+            for token, tf in counts.items():
+                rows.append(row)
+                cols.append(self.vocab.setdefault(token, len(self.vocab)))
+                tfs.append(tf)
+        
+        self.doc_lens = np.asarray(lens, dtype=np.int32)
+        self.avg_doc_len = sum(lens) / self.total_docs if self.total_docs > 0 else 0
+        self._build_postings(rows, cols, tfs)
+    
+    def _build_postings(self, rows: List[int], cols: List[int], tfs: List[int]):
+        """Build the IDF table and term-major posting arrays.
         
-        self.avg_doc_len = total_len / self.total_docs if self.total_docs > 0 else 0
+        Args:
+            rows: Document index of each entry
+            cols: Term ID of each entry
+            tfs: Term frequency of each entry
+        """
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+        tf = np.asarray(tfs, dtype=np.float32)
+        
+        df = np.bincount(cols, minlength=len(self.vocab))
+        idf = np.log((self.total_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        norm = 1 - self.b + self.b * (self.doc_lens[rows] / (self.avg_doc_len or 1))
+        weights = idf[cols] * (tf * (self.k1 + 1)) / (tf + self.k1 * norm)
+        
+        # Group entries by term; a stable sort keeps each list in document order
+        order = np.argsort(cols, kind="stable")
+        self.idf = idf
+        self.postings_indptr = np.concatenate(([0], np.cumsum(df))).astype(np.int64)
+        self.postings_docs = rows[order]
+        self.postings_weights = weights[order].astype(np.float32)
     
-    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
-        """Search documents using BM25.
+    def save(self, arrays_path: Path, vocab_path: Path) -> None:
+        """Persist the index as NumPy arrays plus a JSON vocabulary.
         
         Args:
-            query: Search query
-            k: Number of results
-            
-        Returns:
-            List of (doc_id, score) tuples
+            arrays_path: Destination .npz for the posting, IDF and length arrays
+            vocab_path: Destination .json for the vocabulary and document IDs
         """
-        query_tokens = self._tokenize(query)
-        scores = defaultdict(float)
-        
-        for token in query_tokens:
-            if token in self.inverted_index:
-                idf = self._calculate_idf(token)
-                
-                for doc_id in self.inverted_index[token]:
-                    doc = self.documents[doc_id]
-                    tf = self._calculate_tf(token, doc.text)
-                    doc_len = self.doc_lens[doc_id]
-                    
-                    # BM25 score calculation
-                    norm = 1 - self.b + self.b * (doc_len / self.avg_doc_len)
-                    score = idf * (tf * (self.k1 + 1)) / (tf + self.k1 * norm)
-                    scores[doc_id] += score
-        
-        # Sort by score
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_scores[:k]
+        _atomic_write(arrays_path, lambda f: np.savez(
+            f,
+            indptr=self.postings_indptr,
+            docs=self.postings_docs,
+            weights=self.postings_weights,
+            idf=self.idf,
+            doc_lens=self.doc_lens
+        ))
+        
+        # Terms in ID order, so the vocab dict is rebuilt by position
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "avg_doc_len": self.avg_doc_len,
+            "vocab": sorted(self.vocab, key=self.vocab.__getitem__),
+            "doc_ids": self.doc_ids
+        }
+        _atomic_write(vocab_path, lambda f: json.dump(meta, f), mode="w")
     
-    def _tokenize(self, text: str) -> List[str]:
-        """Advanced tokenization with stopword removal.
+    def load(self, arrays_path: Path, vocab_path: Path) -> bool:
+        """Load an index written by save().
         
         Args:
-            text: Text to tokenize
+            arrays_path: Saved .npz posting, IDF and length arrays
+            vocab_path: Saved .json vocabulary and document IDs
             
         Returns:
-            List of tokens
+            True if the index was loaded, False if it is missing or unusable
         """
-        import re
-        
-        # Common stopwords
-        stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'must', 'can', 'shall', 'it', 'this',
-            'that', 'these', 'those', 'i', 'you', 'he', 'she', 'we', 'they', 'them'
-        }
-        
-        # Convert to lowercase and split on non-alphanumeric
-        tokens = re.findall(r'\b\w+\b', text.lower())
-        
-        # Remove stopwords and very short tokens
-        tokens = [t for t in tokens if t not in stopwords and len(t) > 2]
-        
-        return tokens
+        try:
+            with open(vocab_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["k1"] != self.k1 or meta["b"] != self.b:
+                return False
+            
+            terms, doc_ids = meta["vocab"], meta["doc_ids"]
+            with np.load(arrays_path, allow_pickle=False) as arrays:
+                indptr = arrays["indptr"]
+                docs = arrays["docs"]
+                weights = arrays["weights"]
+                idf = arrays["idf"]
+                doc_lens = arrays["doc_lens"]
+            if (
+                indptr.size != len(terms) + 1 or idf.size != len(terms)
+                or doc_lens.size != len(doc_ids)
+                or not indptr[-1] == docs.size == weights.size
+            ):
+                raise ValueError("index arrays do not match the vocabulary")
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            logger.warning(f"Failed to load BM25 index: {str(e)}")
+            return False
+        
+        self.vocab = {term: term_id for term_id, term in enumerate(terms)}
+        self.doc_ids = doc_ids
+        self.total_docs = len(doc_ids)
+        self.avg_doc_len = meta["avg_doc_len"]
+        self.doc_lens = doc_lens
+        self.idf = idf
+        self.postings_indptr = indptr
+        self.postings_docs = docs
+        self.postings_weights = weights
+        return True
     
-    def _calculate_idf(self, token: str) -> float:
-        """Calculate IDF for a token.
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Search documents using BM25.
         
         Args:
-            token: Token
+            query: Search query
+            k: Number of results
             
         Returns:
-            IDF score
+            List of (doc_id, score) tuples
         """
-        doc_freq = self.doc_freqs[token]
-        if doc_freq == 0:
-            return 0
-        return math.log((self.total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        if not self.total_docs:
+            return []
+        
+        # BM25 sums over unique query terms. Terms found in half or more of
+        # the documents have a non-positive IDF and are not worth scoring,
+        # unless they are all the query has (e.g. a one-chunk startup).
+        term_ids = list({self.vocab[t] for t in self._tokenize(query) if t in self.vocab})
+        if not term_ids:
+            return []
+        informative = [t for t in term_ids if self.idf[t] > 0]
+        if informative:
+            term_ids = informative
+        
+        # Gather only the query terms' posting lists and scatter-add them
+        # into per-document scores with a single bincount
+        indptr = self.postings_indptr
+        spans = [slice(indptr[t], indptr[t + 1]) for t in term_ids]
+        scores = np.bincount(
+            np.concatenate([self.postings_docs[span] for span in spans]),
+            weights=np.concatenate([self.postings_weights[span] for span in spans]),
+            minlength=self.total_docs
+        )
+        
+        # Top-k among the documents that matched any query term
+        matched = np.flatnonzero(scores)
+        if matched.size > k:
+            matched = matched[np.argpartition(-scores[matched], k)[:k]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+        
+        return [(self.doc_ids[i], float(scores[i])) for i in matched]
     
-    def _calculate_tf(self, token: str, text: str) -> int:
-        """Calculate term frequency.
+    def _tokenize(self, text: str) -> List[str]:
+        """Advanced tokenization with stopword removal.
         
         Args:
-            token: Token
-            text: Document text
+            text: Text to tokenize
             
         Returns:
-            Term frequency
+            List of tokens
         """
-        tokens = self._tokenize(text)
-        return tokens.count(token)
+        return _tokenize(text)
 
 
 class HybridRetriever:
@@ -179,60 +360,75 @@ class HybridRetriever:
         existing_chunks = get_chunks(startup_id)
         if existing_chunks:
             self.documents = {chunk.chunk_id: chunk for chunk in existing_chunks}
-            self.bm25_retriever.index_documents(existing_chunks)
+            if not self._load_bm25_index(len(existing_chunks)):
+                self.bm25_retriever.index_documents(existing_chunks)
+                self._save_bm25_index()
             logger.info(f"Loaded {len(existing_chunks)} existing chunks for {startup_id}")
     
+    def _bm25_index_paths(self) -> Tuple[Path, Path, Path]:
+        """Get the stored chunk file and its BM25 index files.
+        
+        Returns:
+            Tuple of (chunk file, index arrays, index vocabulary) paths
+        """
+        from ..services.chunk_store import chunk_file_path
+        chunk_path = chunk_file_path(self.startup_id)
+        return (
+            chunk_path,
+            chunk_path.parent / f"{self.startup_id}.bm25.npz",
+            chunk_path.parent / f"{self.startup_id}.bm25.json"
+        )
+    
+    def _load_bm25_index(self, n_chunks: int) -> bool:
+        """Load the persisted BM25 index if it is at least as new as the chunks.
+        
+        Args:
+            n_chunks: Number of stored chunks the index must cover
+            
+        Returns:
+            True if the BM25 retriever was loaded from disk
+        """
+        chunk_path, arrays_path, vocab_path = self._bm25_index_paths()
+        try:
+            chunks_mtime = chunk_path.stat().st_mtime_ns
+            if min(arrays_path.stat().st_mtime_ns, vocab_path.stat().st_mtime_ns) < chunks_mtime:
+                return False
+        except OSError:
+            return False
+        
+        return (
+            self.bm25_retriever.load(arrays_path, vocab_path)
+            and self.bm25_retriever.total_docs == n_chunks
+        )
+    
+    def _save_bm25_index(self) -> None:
+        """Persist the BM25 index next to the stored chunks it was built from."""
+        chunk_path, arrays_path, vocab_path = self._bm25_index_paths()
+        if not chunk_path.exists():
+            # Chunks only held in memory; there is nothing to validate against
+            return
+        try:
+            self.bm25_retriever.save(arrays_path, vocab_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to persist BM25 index: {str(e)}")
+    
     async def index_documents(self, documents: List[DocumentChunk]):
         """Index documents for retrieval.
         
         Args:
             documents: List of document chunks
         """
-        # Handle both Chunk and DocumentChunk types
-        if documents:
-            if hasattr(documents[0], 'chunk_id'):
-                # It's a Chunk object
-                self.documents = {doc.chunk_id: doc for doc in documents}
-            else:
-                # It's a DocumentChunk object
-                self.documents = {doc.id: doc for doc in documents}
-        else:
-            self.documents = {}
+        # Handle both Chunk and DocumentChunk types in one pass
+        normalized = [_normalize_doc(doc) for doc in documents]
+        self.documents = {n.id: doc for n, doc in zip(normalized, documents)}
         
         # Index for BM25
-        self.bm25_retriever.index_documents(documents)
+        self.bm25_retriever.index_documents(normalized)
         
         # Index for vector search
-        texts = []
-        ids = []
-        for doc in documents:
-            if hasattr(doc, 'text'):
-                texts.append(doc.text)
-            elif hasattr(doc, 'content'):
-                texts.append(doc.content)
-            
-            if hasattr(doc, 'chunk_id'):
-                ids.append(doc.chunk_id)
-            elif hasattr(doc, 'id'):
-                ids.append(doc.id)
-        metadata = []
-        for doc in documents:
-            meta = {}
-            if hasattr(doc, 'text'):
-                meta['text'] = doc.text
-            elif hasattr(doc, 'content'):
-                meta['text'] = doc.content
-            
-            if hasattr(doc, 'type'):
-                meta['type'] = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
-            
-            if hasattr(doc, 'source'):
-                meta['source'] = doc.source
-            
-            if hasattr(doc, 'metadata'):
-                meta['metadata'] = doc.metadata
-            
-            metadata.append(meta)
+        texts = [n.text for n in normalized]
+        ids = [n.id for n in normalized]
+        metadata = [n.meta for n in normalized]
         
         # Generate embeddings
         embeddings = await self.embedding_service.embed_batch(texts)
@@ -265,105 +461,165 @@ class HybridRetriever:
             logger.warning(f"No documents indexed for startup {self.startup_id}")
             return evidence_list
         
-        try:
-            # Get vector search results
-            query_embedding = await self.embedding_service.embed_text(query)
-            vector_results = await self.vector_index.search(
-                query_embedding,
-                k=self.settings.VECTOR_K,
-                filter=filter
-            )
-        except Exception as e:
-            logger.warning(f"Vector search failed: {str(e)}")
+        # Run BM25 in a worker thread while the query is embedded and the
+        # vector index searched; neither depends on the other
+        vector_results, bm25_results = await asyncio.gather(
+            self._vector_search(query, filter),
+            asyncio.to_thread(self.bm25_retriever.search, query, self.settings.BM25_K),
+            return_exceptions=True
+        )
+        
+        if isinstance(vector_results, Exception):
+            logger.warning(f"Vector search failed: {str(vector_results)}")
             vector_results = []
         
-        try:
-            # Get BM25 results
-            bm25_results = self.bm25_retriever.search(query, k=self.settings.BM25_K)
-        except Exception as e:
-            logger.warning(f"BM25 search failed: {str(e)}")
+        if isinstance(bm25_results, Exception):
+            logger.warning(f"BM25 search failed: {str(bm25_results)}")
             bm25_results = []
         
         # If both searches failed, return all documents with low scores
         if not vector_results and not bm25_results:
             logger.warning("Both search methods failed, returning all documents")
-            for doc_id, doc in list(self.documents.items())[:k]:
+            for doc in islice(self.documents.values(), k):
                 evidence = self._create_evidence(doc, 0.1)
                 evidence_list.append(evidence)
             return evidence_list
         
         # Merge and re-rank results
-        merged_results = self._merge_results(vector_results, bm25_results)
+        merged_results = self._merge_results(vector_results, bm25_results, k)
         
         # Convert to Evidence objects
-        for doc_id, score in merged_results[:k]:
-            if doc_id in self.documents:
-                doc = self.documents[doc_id]
-                evidence = self._create_evidence(doc, score)
-                evidence_list.append(evidence)
+        added_ids = set()
+        for doc_id, score in merged_results:
+            doc = self.documents.get(doc_id)
+            if doc is not None:
+                evidence_list.append(self._create_evidence(doc, score))
+                added_ids.add(doc_id)
+        
+        if len(evidence_list) >= k:
+            return evidence_list
         
-        # If we don't have enough results, add more documents
-        if len(evidence_list) < k:
-            added_ids = {e.id for e in evidence_list}
-            for doc_id, doc in self.documents.items():
-                if doc_id not in added_ids:
-                    evidence = self._create_evidence(doc, 0.1)
-                    evidence_list.append(evidence)
-                    if len(evidence_list) >= k:
-                        break
+        # If we don't have enough results, add more documents in store order
+        remaining = (doc for doc_id, doc in self.documents.items() if doc_id not in added_ids)
+        for doc in islice(remaining, k - len(evidence_list)):
+            evidence_list.append(self._create_evidence(doc, 0.1))
         
         return evidence_list
     
+    async def _vector_search(
+        self,
+        query: str,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[SearchResult]:
+        """Embed the query and search the vector index.
+        
+        Args:
+            query: Search query
+            filter: Optional filter criteria
+            
+        Returns:
+            Vector search results
+        """
+        query_embedding = await self.embedding_service.embed_text(query)
+        return await self.vector_index.search(
+            query_embedding,
+            k=self.settings.VECTOR_K,
+            filter=filter
+        )
+    
     def _merge_results(
         self,
         vector_results: List[SearchResult],
-        bm25_results: List[Tuple[str, float]]
+        bm25_results: List[Tuple[str, float]],
+        k: int
     ) -> List[Tuple[str, float]]:
         """Merge and re-rank results from different retrievers.
         
         Args:
             vector_results: Vector search results
             bm25_results: BM25 search results
+            k: Number of results to keep
+            
+        Returns:
+            Top-k merged and re-ranked results
+        """
+        if self.settings.RETRIEVAL_FUSION == "ws":
+            return self._weighted_sum(vector_results, bm25_results, k)
+        return self._reciprocal_rank_fusion(vector_results, bm25_results, k)
+    
+    def _reciprocal_rank_fusion(
+        self,
+        vector_results: List[SearchResult],
+        bm25_results: List[Tuple[str, float]],
+        k: int
+    ) -> List[Tuple[str, float]]:
+        """Fuse result lists by rank, ignoring their raw score scales.
+        
+        Each document scores sum(1 / (k + rank)) over the lists it appears
+        in. The sum is scaled so that ranking first in every non-empty list
+        gives 1.0, which keeps it usable as an evidence confidence.
+        
+        Args:
+            vector_results: Vector search results
+            bm25_results: BM25 search results
+            k: Number of results to keep
+            
+        Returns:
+            Top-k merged and re-ranked results
+        """
+        rrf_k = self.settings.RRF_K
+        rrf = defaultdict(float)
+        for rank, r in enumerate(vector_results, start=1):
+            rrf[r.id] += 1.0 / (rrf_k + rank)
+        for rank, (doc_id, _) in enumerate(bm25_results, start=1):
+            rrf[doc_id] += 1.0 / (rrf_k + rank)
+        
+        scale = (rrf_k + 1) / max(1, bool(vector_results) + bool(bm25_results))
+        scores = np.fromiter(rrf.values(), dtype=np.float64, count=len(rrf)) * scale
+        return _top_k(list(rrf), scores, k)
+    
+    def _weighted_sum(
+        self,
+        vector_results: List[SearchResult],
+        bm25_results: List[Tuple[str, float]],
+        k: int
+    ) -> List[Tuple[str, float]]:
+        """Fuse result lists by a weighted sum of max-normalized scores.
+        
+        Args:
+            vector_results: Vector search results
+            bm25_results: BM25 search results
+            k: Number of results to keep
             
         Returns:
-            Merged and re-ranked results
+            Top-k merged and re-ranked results
         """
-        # Normalize scores
         vector_scores = {r.id: r.score for r in vector_results}
         bm25_scores = dict(bm25_results)
+        all_ids = list(vector_scores.keys() | bm25_scores.keys())
+        if not all_ids:
+            return []
+        
+        # Scores aligned on the union of IDs (0 where a retriever missed it)
+        n = len(all_ids)
+        v = np.fromiter((vector_scores.get(i, 0.0) for i in all_ids), dtype=np.float64, count=n)
+        b = np.fromiter((bm25_scores.get(i, 0.0) for i in all_ids), dtype=np.float64, count=n)
         
         # Normalize to 0-1 range
         if vector_scores:
-            max_vector = max(vector_scores.values())
-            vector_scores = {k: v/max_vector for k, v in vector_scores.items()}
+            v /= max(vector_scores.values()) or 1.0
         
         if bm25_scores:
             max_bm25 = max(bm25_scores.values())
             if max_bm25 > 0:
-                bm25_scores = {k: v/max_bm25 for k, v in bm25_scores.items()}
+                b /= max_bm25
             else:
-                bm25_scores = {k: 0.5 for k in bm25_scores.keys()}
+                b = np.fromiter((0.5 if i in bm25_scores else 0.0 for i in all_ids), dtype=np.float64, count=n)
         
         # Combine scores (weighted average)
-        vector_weight = 0.7
-        bm25_weight = 0.3
-        
-        combined_scores = {}
-        all_ids = set(vector_scores.keys()) | set(bm25_scores.keys())
-        
-        for doc_id in all_ids:
-            v_score = vector_scores.get(doc_id, 0)
-            b_score = bm25_scores.get(doc_id, 0)
-            combined_scores[doc_id] = vector_weight * v_score + bm25_weight * b_score
-        
-        # Sort by combined score
-        sorted_results = sorted(
-            combined_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        combined = 0.7 * v + 0.3 * b
         
-        return sorted_results
+        return _top_k(all_ids, combined, k)
     
     def _create_evidence(self, doc: DocumentChunk, score: float) -> Evidence:
         """Create evidence from document chunk.
@@ -1,6 +1,6 @@
 """Scoring service for startup evaluation."""
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
 
@@ -11,6 +11,104 @@ from ..core.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Tiered KPI bonuses as (thresholds, bonuses) lookup tables. A value's tier is
+# np.searchsorted(thresholds, value, side), so bonuses has one more entry than
+# thresholds. "Higher is better" tables use side="right" (value >= threshold
+# moves up a tier); cac_ltv_ratio is "lower is better" and uses side="left".
+_ARR_TIERS = (np.array([1_000_000, 5_000_000, 10_000_000]), np.array([0.0, 0.1, 0.2, 0.3]))
+_GROWTH_RATE_TIERS = (np.array([1.5, 2.0, 3.0]), np.array([0.0, 0.1, 0.15, 0.2]))
+_LOGO_RETENTION_TIERS = (np.array([0.90, 0.95]), np.array([0.0, 0.05, 0.1]))
+_NRR_TIERS = (np.array([1.1, 1.3]), np.array([0.0, 0.05, 0.1]))
+_GROSS_MARGIN_TIERS = (np.array([0.6, 0.7, 0.8]), np.array([0.0, 0.1, 0.15, 0.25]))
+_CAC_LTV_TIERS = (np.array([0.33, 0.5]), np.array([0.2, 0.1, 0.0]))
+_BURN_MULTIPLE_TIERS = (np.array([1.0, 1.5]), np.array([0.0, 0.1, 0.15]))
+_RUNWAY_TIERS = (np.array([6, 12, 18]), np.array([-0.1, 0.0, 0.05, 0.1]))
+
+_KPI_FIELDS = (
+    'arr', 'growth_rate', 'gross_margin', 'cac_ltv_ratio',
+    'burn_rate', 'runway_months', 'logo_retention', 'nrr'
+)
+
+# Counterfactual changes to these KPIs are deltas; all others are absolute values
+_DELTA_KPIS = frozenset({'growth_rate', 'gross_margin', 'cac_ltv_ratio'})
+
+
+def _kpi_arrays(kpis_list: List[KPIMetrics]) -> Dict[str, np.ndarray]:
+    """Stack KPI fields into aligned float arrays, with missing values as 0."""
+    n = len(kpis_list)
+    return {
+        field: np.fromiter(
+            (getattr(kpis, field) or 0.0 for kpis in kpis_list),
+            dtype=np.float64,
+            count=n
+        )
+        for field in _KPI_FIELDS
+    }
+
+
+def _tier_bonus(
+    values: np.ndarray,
+    tiers: Tuple[np.ndarray, np.ndarray],
+    side: str = "right"
+) -> np.ndarray:
+    """Look up the tier bonus of each value; missing (0) values earn none."""
+    thresholds, bonuses = tiers
+    return np.where(values != 0, bonuses[np.searchsorted(thresholds, values, side=side)], 0.0)
+
+
+def _growth_scores(kpis: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vectorized growth component score (0-1) over stacked KPI arrays."""
+    score = (
+        0.5
+        + _tier_bonus(kpis['arr'], _ARR_TIERS)
+        + _tier_bonus(kpis['growth_rate'], _GROWTH_RATE_TIERS)
+        + _tier_bonus(kpis['logo_retention'], _LOGO_RETENTION_TIERS)
+        + _tier_bonus(kpis['nrr'], _NRR_TIERS)
+    )
+    return np.minimum(1.0, score)
+
+
+def _unit_econ_scores(kpis: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vectorized unit economics component score (0-1) over stacked KPI arrays."""
+    arr, burn_rate = kpis['arr'], kpis['burn_rate']
+    annual_burn = burn_rate * 12
+    burn_multiple = np.divide(arr, annual_burn, out=np.zeros_like(arr), where=burn_rate > 0)
+    
+    score = (
+        0.5
+        + _tier_bonus(kpis['gross_margin'], _GROSS_MARGIN_TIERS)
+        + _tier_bonus(kpis['cac_ltv_ratio'], _CAC_LTV_TIERS, side="left")
+        + _tier_bonus(burn_multiple, _BURN_MULTIPLE_TIERS)
+        + _tier_bonus(kpis['runway_months'], _RUNWAY_TIERS)
+    )
+    return np.clip(score, 0.0, 1.0)
+
+
+def _weighted_scores(
+    kpis: Dict[str, np.ndarray],
+    persona_weights: Dict[str, float],
+    founder_signal: float
+) -> np.ndarray:
+    """Vectorized weighted score over KPI arrays that broadcast together."""
+    shape = np.broadcast_shapes(*(values.shape for values in kpis.values()))
+    kpis = {field: np.broadcast_to(values, shape) for field, values in kpis.items()}
+    return (
+        _growth_scores(kpis) * persona_weights.get('growth', 0.4)
+        + _unit_econ_scores(kpis) * persona_weights.get('unit_econ', 0.4)
+        + founder_signal * persona_weights.get('founder', 0.2)
+    )
+
+
+def _tier_edges(thresholds: np.ndarray) -> np.ndarray:
+    """Values at and just either side of each tier threshold."""
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    return np.concatenate([
+        thresholds,
+        np.nextafter(thresholds, -np.inf),
+        np.nextafter(thresholds, np.inf)
+    ])
+
+
 @dataclass
 class ScoringResult:
     """Scoring result."""
@@ -83,6 +181,24 @@ class StartupScorer:
             reasoning=reasoning
         )
     
+    def calculate_scores_batch(
+        self,
+        kpis_list: List[KPIMetrics],
+        persona_weights: Dict[str, float],
+        founder_signal: float = 0.5
+    ) -> np.ndarray:
+        """Calculate weighted scores for many KPI sets in one vectorized pass.
+        
+        Args:
+            kpis_list: KPIs of each startup or scenario
+            persona_weights: Scoring weights
+            founder_signal: Founder quality signal (0-1)
+            
+        Returns:
+            Array of weighted scores, aligned with kpis_list
+        """
+        return _weighted_scores(_kpi_arrays(kpis_list), persona_weights, founder_signal)
+    
     def _calculate_growth_score(self, kpis: KPIMetrics) -> float:
         """Calculate growth component score.
         
@@ -92,41 +208,7 @@ class StartupScorer:
         Returns:
             Growth score (0-1)
         """
-        score = 0.5  # Base score
-        
-        # ARR score
-        if kpis.arr:
-            if kpis.arr >= 10_000_000:  # $10M+ ARR
-                score += 0.3
-            elif kpis.arr >= 5_000_000:  # $5M+ ARR
-                score += 0.2
-            elif kpis.arr >= 1_000_000:  # $1M+ ARR
-                score += 0.1
-        
-        # Growth rate score
-        if kpis.growth_rate:
-            if kpis.growth_rate >= 3.0:  # 3x+ growth
-                score += 0.2
-            elif kpis.growth_rate >= 2.0:  # 2x+ growth
-                score += 0.15
-            elif kpis.growth_rate >= 1.5:  # 1.5x+ growth
-                score += 0.1
-        
-        # Logo retention score
-        if kpis.logo_retention:
-            if kpis.logo_retention >= 0.95:
-                score += 0.1
-            elif kpis.logo_retention >= 0.90:
-                score += 0.05
-        
-        # NRR score
-        if kpis.nrr:
-            if kpis.nrr >= 1.3:  # 130%+ NRR
-                score += 0.1
-            elif kpis.nrr >= 1.1:  # 110%+ NRR
-                score += 0.05
-        
-        return min(1.0, score)
+        return float(_growth_scores(_kpi_arrays([kpis]))[0])
     
     def _calculate_unit_econ_score(self, kpis: KPIMetrics) -> float:
         """Calculate unit economics score.
@@ -137,42 +219,7 @@ class StartupScorer:
         Returns:
             Unit economics score (0-1)
         """
-        score = 0.5  # Base score
-        
-        # Gross margin score
-        if kpis.gross_margin:
-            if kpis.gross_margin >= 0.8:  # 80%+ margin
-                score += 0.25
-            elif kpis.gross_margin >= 0.7:  # 70%+ margin
-                score += 0.15
-            elif kpis.gross_margin >= 0.6:  # 60%+ margin
-                score += 0.1
-        
-        # CAC/LTV ratio score
-        if kpis.cac_ltv_ratio:
-            if kpis.cac_ltv_ratio <= 0.33:  # LTV/CAC >= 3
-                score += 0.2
-            elif kpis.cac_ltv_ratio <= 0.5:  # LTV/CAC >= 2
-                score += 0.1
-        
-        # Burn efficiency score
-        if kpis.burn_rate and kpis.arr:
-            burn_multiple = kpis.arr / (kpis.burn_rate * 12) if kpis.burn_rate > 0 else 0
-            if burn_multiple >= 1.5:
-                score += 0.15
-            elif burn_multiple >= 1.0:
-                score += 0.1
-        
-        # Runway score
-        if kpis.runway_months:
-            if kpis.runway_months >= 18:
-                score += 0.1
-            elif kpis.runway_months >= 12:
-                score += 0.05
-            elif kpis.runway_months < 6:
-                score -= 0.1
-        
-        return min(1.0, max(0.0, score))
+        return float(_unit_econ_scores(_kpi_arrays([kpis]))[0])
     
     def _get_recommendation(self, score: float) -> RecommendationType:
         """Get recommendation based on score.
@@ -246,7 +293,8 @@ class CounterfactualAnalyzer:
             target_recommendation: Target recommendation (optional)
             
         Returns:
-            Minimum required changes
+            Value each KPI would need on its own to reach the target; KPIs
+            that cannot reach it alone are omitted
         """
         # Determine target score
         current_rec = self._get_recommendation(current_score)
@@ -263,46 +311,75 @@ class CounterfactualAnalyzer:
                 # Already at invest, show what it takes to drop
                 target_score = self.settings.FOLLOW_THRESHOLD - 0.01
         
-        score_gap = target_score - current_score
+        # The KPI grid holds the founder signal constant; carry the caller's
+        # score offset so candidates are compared on the same scale
+        base = _kpi_arrays([current_kpis])
+        offset = current_score - _weighted_scores(base, persona_weights, founder_signal=0.5)[0]
+        raising = target_score > current_score
         
-        # Calculate required changes for each component
+        # Score is a step function of each KPI, so the smallest change that
+        # crosses the target lies at one of that KPI's tier edges
         breakpoints = {}
+        for field, candidates in self._breakpoint_candidates(current_kpis).items():
+            scores = _weighted_scores({**base, field: candidates}, persona_weights, founder_signal=0.5) + offset
+            reached = scores >= target_score if raising else scores <= target_score
+            if reached.any():
+                distance = np.where(reached, np.abs(candidates - getattr(current_kpis, field)), np.inf)
+                breakpoints[field] = float(candidates[distance.argmin()])
         
-        # Growth metrics
-        growth_weight = persona_weights.get('growth', 0.4)
-        if growth_weight > 0:
-            growth_contribution_needed = score_gap / growth_weight
-            
-            # Estimate ARR change needed
-            if current_kpis.arr:
-                arr_multiplier = 1 + (growth_contribution_needed * 2)
-                breakpoints['arr'] = current_kpis.arr * arr_multiplier
-            
-            # Estimate growth rate change needed
-            if current_kpis.growth_rate:
-                breakpoints['growth_rate'] = current_kpis.growth_rate + growth_contribution_needed
+        return breakpoints
+    
+    def _breakpoint_candidates(self, kpis: KPIMetrics) -> Dict[str, np.ndarray]:
+        """Candidate values for each KPI the breakpoint search may move.
         
-        # Unit economics metrics
-        unit_econ_weight = persona_weights.get('unit_econ', 0.4)
-        if unit_econ_weight > 0:
-            unit_econ_contribution_needed = score_gap / unit_econ_weight
+        Args:
+            kpis: Current KPIs
             
-            # Estimate gross margin change needed
-            if current_kpis.gross_margin:
-                breakpoints['gross_margin'] = min(
-                    1.0,
-                    current_kpis.gross_margin + unit_econ_contribution_needed * 0.3
-                )
+        Returns:
+            Mapping of KPI name to candidate absolute values
+        """
+        candidates = {}
+        for field, (thresholds, _) in (
+            ('arr', _ARR_TIERS),
+            ('growth_rate', _GROWTH_RATE_TIERS),
+            ('gross_margin', _GROSS_MARGIN_TIERS)
+        ):
+            if getattr(kpis, field):
+                candidates[field] = _tier_edges(thresholds)
+        
+        # Burn only scores through the burn multiple arr / (burn * 12)
+        if kpis.burn_rate and kpis.arr:
+            candidates['burn_rate'] = _tier_edges(kpis.arr / (12 * _BURN_MULTIPLE_TIERS[0]))
+        
+        return candidates
+    
+    def simulate_grid(
+        self,
+        current_kpis: KPIMetrics,
+        change_grid: Dict[str, np.ndarray],
+        persona_weights: Dict[str, float]
+    ) -> np.ndarray:
+        """Score a grid of KPI changes in one vectorized pass.
+        
+        Changes follow simulate_change: growth_rate, gross_margin and
+        cac_ltv_ratio are deltas, other KPIs are absolute values. The grid
+        arrays are broadcast against each other.
+        
+        Args:
+            current_kpis: Current KPIs
+            change_grid: KPI name -> array of changes
+            persona_weights: Scoring weights
             
-            # Estimate burn reduction needed
-            if current_kpis.burn_rate:
-                burn_reduction = unit_econ_contribution_needed * 0.5
-                breakpoints['burn_rate'] = max(
-                    0,
-                    current_kpis.burn_rate * (1 - burn_reduction)
-                )
+        Returns:
+            Array of scores with the broadcast shape of the grid
+        """
+        kpis = _kpi_arrays([current_kpis])
+        for key, values in change_grid.items():
+            if key in kpis:
+                values = np.asarray(values, dtype=np.float64)
+                kpis[key] = kpis[key] + values if key in _DELTA_KPIS else values
         
-        return breakpoints
+        return _weighted_scores(kpis, persona_weights, founder_signal=0.5)
     
     def simulate_change(
         self,
@@ -324,7 +401,7 @@ class CounterfactualAnalyzer:
         new_kpis_dict = current_kpis.dict()
         for key, value in changes.items():
             if hasattr(current_kpis, key):
-                if key in ['growth_rate', 'gross_margin', 'cac_ltv_ratio']:
+                if key in _DELTA_KPIS:
                     # These are deltas
                     current_value = new_kpis_dict.get(key, 0) or 0
                     new_kpis_dict[key] = current_value + value
@@ -26,30 +26,34 @@ class StressTestService:
         Returns:
             Stress test results
         """
-        stressed_kpis = kpis.dict()
+        update: Dict[str, Any] = {}
         
         if scenario == "revenue_shock":
             # Scenario A: revenue -20%, churn +2%
             if kpis.arr:
-                stressed_kpis['arr'] = kpis.arr * 0.8
+                update['arr'] = kpis.arr * 0.8
             if kpis.growth_rate:
-                stressed_kpis['growth_rate'] = kpis.growth_rate * 0.7
+                update['growth_rate'] = kpis.growth_rate * 0.7
                 
         elif scenario == "funding_delay":
             # Scenario B: fundraise delayed 6 months
             if kpis.runway_months:
-                stressed_kpis['runway_months'] = max(0, kpis.runway_months - 6)
+                update['runway_months'] = max(0, kpis.runway_months - 6)
             if kpis.burn_rate:
-                stressed_kpis['burn_rate'] = kpis.burn_rate * 1.1
+                update['burn_rate'] = kpis.burn_rate * 1.1
                 
         elif scenario == "custom" and custom_params:
             # Apply custom changes
             for key, delta in custom_params.items():
-                if hasattr(kpis, key):
+                if key in KPIMetrics.model_fields:
                     current = getattr(kpis, key) or 0
-                    stressed_kpis[key] = current + delta
+                    update[key] = current + delta
+            # model_copy skips validation, so keep runway a whole number of months
+            if 'runway_months' in update:
+                update['runway_months'] = int(update['runway_months'])
         
-        stressed_metrics = KPIMetrics(**stressed_kpis)
+        # Only the stressed fields change; the rest are already validated
+        stressed_metrics = kpis.model_copy(update=update)
         
         # Calculate impact
         runway_change = (stressed_metrics.runway_months or 0) - (kpis.runway_months or 0)
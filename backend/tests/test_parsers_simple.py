@@ -0,0 +1,97 @@
+"""Tests for the streaming DOCX extractor in parsers_simple."""
+
+import io
+import zipfile
+
+import pytest
+
+from app.services.parsers_simple import parse_docx
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml"
+    ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Target="word/document.xml"
+    Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>
+</Relationships>"""
+
+_DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>"""
+
+_TEXT_BOX = """<w:txbxContent>
+  <w:p><w:r><w:t>Box text</w:t></w:r></w:p>
+</w:txbxContent>"""
+
+# A text box in both AlternateContent branches, a hyperlink, a tab stop
+# definition, a page break and a table: only the run text of the top-level
+# paragraphs should come through
+_BODY = f"""
+<w:p>
+  <w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>
+  <w:r><w:t xml:space="preserve">Intro </w:t></w:r>
+  <w:hyperlink r:id="rId9"><w:r><w:t>link</w:t></w:r></w:hyperlink>
+  <w:r><w:tab/><w:t>end</w:t></w:r>
+</w:p>
+<w:p>
+  <w:r>
+    <mc:AlternateContent>
+      <mc:Choice Requires="wps">
+        <w:drawing><wps:txbx>{_TEXT_BOX}</wps:txbx></w:drawing>
+      </mc:Choice>
+      <mc:Fallback>
+        <w:pict><v:shape><v:textbox>{_TEXT_BOX}</v:textbox></v:shape></w:pict>
+      </mc:Fallback>
+    </mc:AlternateContent>
+  </w:r>
+  <w:r><w:t>Anchor</w:t></w:r>
+</w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+<w:p><w:r><w:t>Before</w:t><w:br w:type="page"/><w:t>After</w:t><w:br/><w:t>line</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">   </w:t></w:r></w:p>
+"""
+
+_DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document
+    xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+    xmlns:v="urn:schemas-microsoft-com:vml">
+  <w:body>{_BODY}</w:body>
+</w:document>"""
+
+
+def _make_docx() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _ROOT_RELS)
+        archive.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS)
+        archive.writestr("word/document.xml", _DOCUMENT)
+    return buffer.getvalue()
+
+
+def test_parse_docx_skips_text_boxes_and_tables():
+    pytest.importorskip("lxml")
+    
+    assert parse_docx(_make_docx(), "pitch.docx") == "\n\n".join([
+        "Intro link\tend",
+        "Anchor",
+        "BeforeAfter\nline",
+    ])
+
+
+def test_parse_docx_matches_python_docx():
+    docx = pytest.importorskip("docx")
+    content = _make_docx()
+    
+    document = docx.Document(io.BytesIO(content))
+    expected = "\n\n".join(p.text for p in document.paragraphs if p.text.strip())
+    
+    assert parse_docx(content, "pitch.docx") == expected
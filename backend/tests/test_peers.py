@@ -0,0 +1,47 @@
+"""Tests for peer percentiles against the shipped demo cohort."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from app.services import peers  # noqa: E402
+
+SHIPPED_PEERS_CSV = Path(__file__).resolve().parents[1] / "data" / "demo" / "peers.csv"
+
+
+@pytest.fixture
+def peers_csv(tmp_path, monkeypatch):
+    """Point the service at a copy of the shipped CSV so no sidecar lands in the repo."""
+    csv_path = tmp_path / "peers.csv"
+    shutil.copy(SHIPPED_PEERS_CSV, csv_path)
+    monkeypatch.setattr(peers, "PEERS_CSV_PATH", csv_path)
+    peers._load_peers.cache_clear()
+    yield csv_path
+    peers._load_peers.cache_clear()
+
+
+def test_growth_and_margin_read_from_shipped_columns(peers_csv):
+    result = peers.PeerComparisonService()._get_csv_peers(
+        {"arr": 5000000, "growth_rate": 2.2, "gross_margin": 0.80}
+    )
+
+    assert result["peer_count"] == 10
+    # 5 of 10 peers grow at 2.2 or less; 9 of 10 have a margin at or below 0.80
+    assert result["percentile_growth"] == pytest.approx(0.5)
+    assert result["percentile_margin"] == pytest.approx(0.9)
+    assert result["median_growth"] == pytest.approx(2.25)
+    assert result["median_margin"] == pytest.approx(0.745)
+
+
+def test_percentiles_follow_the_input(peers_csv):
+    service = peers.PeerComparisonService()
+    low = service._get_csv_peers({"growth": 1.0, "margin": 0.5})
+    high = service._get_csv_peers({"growth": 4.0, "margin": 0.9})
+
+    assert low["percentile_growth"] == 0.0
+    assert low["percentile_margin"] == 0.0
+    assert high["percentile_growth"] == 1.0
+    assert high["percentile_margin"] == 1.0